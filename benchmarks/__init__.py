@@ -0,0 +1,57 @@
+"""
+Benchmarks
+==========
+
+Headless benchmarks of the fkivymd components. For every component they
+measure the construction time, the memory per instance, the number of
+clock events scheduled while constructing and the time the clock needs to
+settle the layout; whole-screen scenarios measure a 1000 rows list and a
+theme style switch.
+
+Run them from the root of the repository::
+
+    python -m benchmarks
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline baseline.json
+
+The results are printed as JSON. With ``--baseline`` they are compared with
+the results of an earlier run, and the exit status is non-zero if any
+metric regressed beyond the tolerance. Timings depend on the machine, keep
+baselines next to the machine that made them.
+
+The leak check creates and destroys instances of every component and fails
+if any instance stays alive or the number of objects and the memory do not
+return to where they were::
+
+    python -m benchmarks.leaks
+"""
+
+import os
+
+
+def setup_kivy(window: bool = False) -> None:
+    """
+    Configures Kivy for measuring, with an offscreen window unless `window`
+    is `True`. Must be called before Kivy is imported.
+    """
+
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    if not window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+
+    from kivy.config import Config
+
+    # The clock must not sleep between the frames being measured.
+    Config.set("graphics", "maxfps", "0")
+
+
+def create_app():
+    """Creates the application the components take their theme from."""
+
+    from kivymd.app import MDApp
+
+    app = MDApp()
+    # Done by the application when it starts.
+    app.theme_cls.set_colors()
+    return app
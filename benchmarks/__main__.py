@@ -0,0 +1,82 @@
+import argparse
+import json
+import platform
+import sys
+
+from . import create_app, setup_kivy
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the fkivymd components.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="components and scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100,
+        help="instances made of every component (default: %(default)s)",
+    )
+    parser.add_argument("--output", help="file to write the results to")
+    parser.add_argument("--baseline", help="results to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed growth of timings and memory (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--window",
+        action="store_true",
+        help="use a real window instead of an offscreen one",
+    )
+    options = parser.parse_args(args)
+
+    setup_kivy(options.window)
+
+    import kivy
+    import kivymd
+
+    from .harness import compare
+    from .suite import components, run_benchmarks, scenarios
+
+    unknown = set(options.names) - set(components) - set(scenarios)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    create_app()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "kivy": kivy.__version__,
+            "kivymd": kivymd.__version__,
+        },
+        "results": run_benchmarks(options.names or None, options.count),
+    }
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf8") as output_file:
+            output_file.write(text + "\n")
+    print(text)
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(
+            report["results"], baseline["results"], options.tolerance
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
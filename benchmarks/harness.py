@@ -0,0 +1,216 @@
+"""
+Measurement helpers of the benchmarks.
+
+The kivy clock is ticked by hand, so the window is never drawn and only the
+work done by the widgets is measured.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+import weakref
+
+from kivy.clock import Clock
+from kivy.lang import Builder
+
+MAX_SETTLE_FRAMES = 10000
+"""Number of frames after which the layout is considered never settling."""
+
+FRAME_TIME = 1 / 60
+"""Time waited for delayed clock events, one frame of a 60 fps app."""
+
+
+def tick() -> None:
+    """Runs one frame of the clock, including the canvas bindings."""
+
+    Clock.tick()
+    Builder.sync()
+
+
+def get_pending_events() -> list:
+    """Returns the scheduled one-time clock events."""
+
+    return [event for event in Clock.get_events() if not event.loop]
+
+
+def settle(busy=None) -> tuple:
+    """
+    Ticks the clock until no one-time events are scheduled and `busy()`,
+    if given, returns `False`. Returns the elapsed time and the time spent
+    ticking in seconds, and the number of frames.
+    """
+
+    start = time.perf_counter()
+    tick_time = 0
+    frames = 0
+    while frames < MAX_SETTLE_FRAMES:
+        tick_start = time.perf_counter()
+        tick()
+        tick_time += time.perf_counter() - tick_start
+        frames += 1
+
+        events = get_pending_events()
+        running = busy is not None and busy()
+        if not events and not running:
+            break
+        if running or all(event.timeout > 0 for event in events):
+            # Only delayed work left: wait for it like an application would.
+            time.sleep(FRAME_TIME)
+    return time.perf_counter() - start, tick_time, frames
+
+
+def measure(factory, count: int) -> dict:
+    """
+    Measures the construction of `count` widgets returned by `factory`.
+    The first widget is made beforehand, so the one-time loading of the kv
+    rules is left out.
+    """
+
+    factory()
+    settle()
+    gc.collect()
+
+    events = len(get_pending_events())
+    start = time.perf_counter()
+    widgets = [factory() for _ in range(count)]
+    construct_time = time.perf_counter() - start
+    events = len(get_pending_events()) - events
+    settle_time, tick_time, settle_frames = settle()
+
+    del widgets
+    settle()
+    gc.collect()
+
+    # A separate run: tracing slows down the construction.
+    tracemalloc.start()
+    memory = tracemalloc.get_traced_memory()[0]
+    widgets = [factory() for _ in range(count)]
+    settle()
+    memory = tracemalloc.get_traced_memory()[0] - memory
+    tracemalloc.stop()
+
+    del widgets
+    settle()
+    gc.collect()
+
+    return {
+        "count": count,
+        "construct_ms": construct_time / count * 1000,
+        "memory_kb": memory / count / 1024,
+        "clock_events": events / count,
+        "settle_ms": settle_time * 1000,
+        "settle_tick_ms": tick_time * 1000,
+        "settle_frames": settle_frames,
+    }
+
+
+def measure_scenario(setup, run, busy=None) -> dict:
+    """
+    Measures `run(state)`, where `state` is the value returned by `setup()`,
+    and the time the clock needs to settle after it. The clock is not
+    settled while `busy(state)`, if given, returns `True`.
+    """
+
+    state = setup()
+    settle()
+    gc.collect()
+
+    events = len(get_pending_events())
+    start = time.perf_counter()
+    run(state)
+    run_time = time.perf_counter() - start
+    events = len(get_pending_events()) - events
+    settle_time, tick_time, settle_frames = settle(
+        None if busy is None else lambda: busy(state)
+    )
+
+    return {
+        "run_ms": run_time * 1000,
+        "clock_events": events,
+        "settle_ms": settle_time * 1000,
+        "settle_tick_ms": tick_time * 1000,
+        "settle_frames": settle_frames,
+    }
+
+
+def check_leaks(factory, count: int, use=None) -> dict:
+    """
+    Creates `count` widgets returned by `factory`, adds them to a layout,
+    calls `use(widgets)`, if given, removes and drops them, in several
+    rounds. Returns the number of widgets
+    of a round still alive after the next round, and the growth of the
+    number of objects and of the memory per widget. The first rounds are
+    left out, so the one-time caches are filled. The memory is traced from
+    the first round on: memory kept for reuse (allocator free lists, the
+    free slots of dicts) is then already counted in the baseline, instead
+    of counting as growth when a later round takes it over.
+    """
+
+    from kivy.uix.boxlayout import BoxLayout
+
+    def run_round():
+        parent = BoxLayout()
+        widgets = [factory() for _ in range(count)]
+        for widget in widgets:
+            parent.add_widget(widget)
+        settle()
+        if use is not None:
+            use(widgets)
+            settle()
+        refs = [weakref.ref(item) for item in widgets]
+        parent.clear_widgets()
+        del widgets, widget, parent
+        settle()
+        gc.collect()
+        return refs
+
+    tracemalloc.start()
+    run_round()
+    run_round()
+
+    objects = len(gc.get_objects())
+    memory = tracemalloc.get_traced_memory()[0]
+    refs = run_round()
+    # Widgets still referenced by the last user of their class (the focused
+    # widget, ...) are released by the next round, they are no leak.
+    run_round()
+    alive = sum(1 for ref in refs if ref() is not None)
+    # The references are not part of the measured growth.
+    del refs
+    objects = len(gc.get_objects()) - objects
+    memory = tracemalloc.get_traced_memory()[0] - memory
+    tracemalloc.stop()
+
+    return {
+        "count": count,
+        "alive": alive,
+        "objects": objects / count / 2,
+        "memory_kb": memory / count / 2 / 1024,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Returns the descriptions of the metrics of `results` that regressed
+    compared with `baseline`. Timings, memory and frames may grow by
+    `tolerance` (a fraction), the number of clock events may not grow.
+    """
+
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if base_value is None or metric == "count":
+                continue
+            limit = (
+                base_value * (1 + tolerance)
+                if metric != "clock_events"
+                else base_value
+            )
+            if value > limit:
+                regressions.append(
+                    f"{name}.{metric}: {value:.3f} (baseline {base_value:.3f})"
+                )
+    return regressions
@@ -0,0 +1,76 @@
+"""
+Checks that the components are released once they are no longer used: no
+instance stays alive, and the number of objects and the memory return to
+where they were, within a small tolerance per instance.
+"""
+
+import argparse
+import json
+import sys
+
+from . import create_app, setup_kivy
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.leaks",
+        description="Check the fkivymd components for leaks.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="components to check (default: all)",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100,
+        help="instances made of every component (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-objects",
+        type=float,
+        default=0.5,
+        help="allowed growth of the objects per instance (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-memory-kb",
+        type=float,
+        default=0.5,
+        help="allowed growth of the memory per instance in KB "
+        "(default: %(default)s)",
+    )
+    options = parser.parse_args(args)
+
+    setup_kivy()
+
+    from .harness import check_leaks
+    from .suite import components, uses
+
+    unknown = set(options.names) - set(components)
+    if unknown:
+        parser.error(f"unknown components: {', '.join(sorted(unknown))}")
+
+    create_app()
+
+    results = {
+        name: check_leaks(factory, options.count, uses.get(name))
+        for name, factory in components.items()
+        if not options.names or name in options.names
+    }
+    print(json.dumps(results, indent=2))
+
+    leaks = [
+        name
+        for name, result in results.items()
+        if result["alive"]
+        or result["objects"] > options.max_objects
+        or result["memory_kb"] > options.max_memory_kb
+    ]
+    for name in leaks:
+        print(f"Leak: {name}", file=sys.stderr)
+    return 1 if leaks else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
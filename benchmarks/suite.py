@@ -0,0 +1,248 @@
+"""
+The measured components and scenarios.
+"""
+
+from __future__ import annotations
+
+from kivy.uix.boxlayout import BoxLayout
+
+from .harness import measure, measure_scenario, settle
+
+
+def _button():
+    from fkivymd.uix.button import FButton, FButtonIcon, FButtonText
+
+    return FButton(FButtonIcon(icon="plus"), FButtonText(text="Button"))
+
+
+def _list_item():
+    from fkivymd.uix.list import (
+        FListItem,
+        FListItemHeadlineText,
+        FListItemLeadingIcon,
+        FListItemSupportingText,
+    )
+
+    return FListItem(
+        FListItemLeadingIcon(icon="account"),
+        FListItemHeadlineText(text="Headline"),
+        FListItemSupportingText(text="Supporting text"),
+    )
+
+
+def _text_field():
+    from fkivymd.uix.textfield import FTextField
+
+    return FTextField(hint_text="Hint text", max_length=10)
+
+
+def _card():
+    from fkivymd.uix.card import FCard
+
+    return FCard(style="elevated")
+
+
+def _dialog():
+    from fkivymd.uix.dialog import FDialog
+
+    return FDialog()
+
+
+def _label():
+    from fkivymd.uix.label import FLabel
+
+    return FLabel(text="Label")
+
+
+def _icon():
+    from fkivymd.uix.label import FIcon
+
+    return FIcon(icon="language-python")
+
+
+def _check_box():
+    from fkivymd.uix.selectioncontrol import FCheckBox
+
+    return FCheckBox()
+
+
+def _speed_dial():
+    from fkivymd.uix.button import (
+        FButton,
+        FButtonIcon,
+        FSpeedDialButton,
+        FSpeedDialButtons,
+        FSpeedDialHintText,
+    )
+
+    button = FButton(FButtonIcon(icon="plus"))
+    stack = FSpeedDialButtons()
+    # The stack buttons are placed from the button the stack is added to.
+    button.add_widget(stack)
+    for icon in ("pencil", "share", "delete"):
+        stack.add_widget(
+            FSpeedDialButton(FSpeedDialHintText(text=icon.title()), icon=icon)
+        )
+    return button
+
+
+def _use_speed_dial(buttons):
+    from kivy.animation import Animation
+
+    from fkivymd.uix.button import FSpeedDialButtons
+
+    def animating():
+        return bool(Animation._instances)
+
+    stacks = [
+        child
+        for button in buttons
+        for child in button.children
+        if isinstance(child, FSpeedDialButtons)
+    ]
+    for button in buttons:
+        button.dispatch("on_release")
+    settle(animating)
+    for stack in stacks:
+        stack.close_stack()
+    settle(animating)
+
+
+components = {
+    "FButton": _button,
+    "FListItem": _list_item,
+    "FTextField": _text_field,
+    "FCard": _card,
+    "FDialog": _dialog,
+    "FLabel": _label,
+    "FIcon": _icon,
+    "FCheckBox": _check_box,
+    "FSpeedDialButtons": _speed_dial,
+}
+"""Factories of the measured components."""
+
+uses = {
+    "FSpeedDialButtons": _use_speed_dial,
+}
+"""
+Functions called with the added widgets of a component by the leak check,
+to release them after they were used and not only shown.
+"""
+
+
+def _list_1k():
+    from fkivymd.uix.list import (
+        FList,
+        FListItem,
+        FListItemHeadlineText,
+        FListItemSupportingText,
+    )
+
+    def run(state):
+        state.append(
+            FList(
+                *[
+                    FListItem(
+                        FListItemHeadlineText(text=f"Item {i}"),
+                        FListItemSupportingText(text="Supporting text"),
+                    )
+                    for i in range(1000)
+                ]
+            )
+        )
+
+    return list, run
+
+
+def _list_1k_async():
+    from fkivymd.uix.list import FList
+
+    def setup():
+        return {"list": FList(), "extension": None}
+
+    def run(state):
+        state["extension"] = state["list"].extend_async(
+            {"headline_text": f"Item {i}", "supporting_text": "Supporting text"}
+            for i in range(1000)
+        )
+
+    def busy(state):
+        return state["extension"].is_triggered
+
+    return setup, run, busy
+
+
+def _recycle_list_1k():
+    from fkivymd.uix.list import FRecycleList
+
+    def run(state):
+        state.append(
+            FRecycleList(
+                data=[
+                    {"headline_text": f"Item {i}", "supporting_text": "Supporting text"}
+                    for i in range(1000)
+                ],
+                size=(400, 800),
+            )
+        )
+
+    return list, run
+
+
+def _theme_toggle():
+    from kivymd.app import MDApp
+
+    from fkivymd.uix.behaviors.theme_transition import theme_transition
+    from fkivymd.uix.button import FButton, FButtonText
+    from fkivymd.uix.card import FCard
+    from fkivymd.uix.label import FLabel
+
+    theme_cls = MDApp.get_running_app().theme_cls
+
+    def setup():
+        screen = BoxLayout()
+        for i in range(200):
+            screen.add_widget(FCard(style="elevated"))
+            screen.add_widget(FButton(FButtonText(text=f"Button {i}")))
+            screen.add_widget(FLabel(text=f"Label {i}"))
+        theme_cls.theme_style_switch_animation = True
+        return screen
+
+    def run(screen):
+        theme_cls.theme_style = (
+            "Dark" if theme_cls.theme_style == "Light" else "Light"
+        )
+        theme_cls.set_colors()
+
+    def busy(screen):
+        return theme_transition.is_running
+
+    return setup, run, busy
+
+
+scenarios = {
+    "list_1k": _list_1k,
+    "list_1k_async": _list_1k_async,
+    "recycle_list_1k": _recycle_list_1k,
+    "theme_toggle": _theme_toggle,
+}
+"""
+Whole-screen scenarios, each returns the `setup`, `run` and optionally `busy`
+functions of :func:`~benchmarks.harness.measure_scenario`.
+"""
+
+
+def run_benchmarks(names=None, count: int = 100) -> dict:
+    """
+    Runs the components and scenarios in `names` (all if `None`), making
+    `count` instances of every component.
+    """
+
+    results = {}
+    for name, factory in components.items():
+        if names is None or name in names:
+            results[name] = measure(factory, count)
+    for name, scenario in scenarios.items():
+        if names is None or name in names:
+            results[name] = measure_scenario(*scenario())
+    return results
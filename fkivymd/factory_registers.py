@@ -1,44 +1,46 @@
 from kivy.factory import Factory
 
 register = Factory.register
-register("FTopAppBar", module="FKivyMD.uix.appbar")
-register("FTopAppBarTitle", module="FKivyMD.uix.appbar")
-register("FTopAppBarIcon", module="FKivyMD.uix.appbar")
-register("FButton", module="FKivyMD.uix.button")
-register("FButtonText", module="FKivyMD.uix.button")
-register("FButtonIcon", module="FKivyMD.uix.button")
-register("FButton2", module="FKivyMD.uix.button")
-register("FIconButton", module="FKivyMD.uix.button")
-register("FSpeedDialButton", module="FKivyMD.uix.button")
-register("FSpeedDialHintText", module="FKivyMD.uix.button")
-register("FSpeedDialButtons", module="FKivyMD.uix.button")
-register("FFrame", module="FKivyMD.uix.card")
-register("FCard", module="FKivyMD.uix.card")
-register("FCardSwipe", module="FKivyMD.uix.card")
-register("FCardSwipeFront", module="FKivyMD.uix.card")
-register("FDialog", module="FKivyMD.uix.dialog")
-register("FDialogHeadlineText", module="FKivyMD.uix.dialog")
-register("FDialogIcon", module="FKivyMD.uix.dialog")
-register("FDialogSupportingText", module="FKivyMD.uix.dialog")
-register("FDialogContentContainer", module="FKivyMD.uix.dialog")
-register("FDialogButtonContainer", module="FKivyMD.uix.dialog")
-register("FDivider", module="FKivyMD.uix.divider")
-register("FLabel", module="FKivyMD.uix.label")
-register("FIcon", module="FKivyMD.uix.label")
-register("FBadge", module="FKivyMD.uix.label")
-register("FList", module="FKivyMD.uix.list")
-register("FListItem", module="FKivyMD.uix.list")
-register("FListItemLeadingAvatar", module="FKivyMD.uix.list")
-register("FListItemLeadingText", module="FKivyMD.uix.list")
-register("FListLeadingIcon", module="FKivyMD.uix.list")
-register("FListItemLeadingThumbnail", module="FKivyMD.uix.list")
-register("FListItemHeadlineText", module="FKivyMD.uix.list")
-register("FListItemSupportingText", module="FKivyMD.uix.list")
-register("FListItemTertiaryText", module="FKivyMD.uix.list")
-register("FListItemTrailingText", module="FKivyMD.uix.list")
-register("FListItemTrailingCheckBox", module="FKivyMD.uix.list")
-register("FListItemTrailingIcon", module="FKivyMD.uix.list")
-register("FCheckBox", module="FKivyMD.uix.selectioncontrol")
-register("FTextField", module="FKivyMD.uix.textfield")
-register("FTextFieldLeadingButton", module="FKivyMD.uix.textfield")
-register("FTextFieldTrailingButton", module="FKivyMD.uix.textfield")
\ No newline at end of file
+register("FTopAppBar", module="fkivymd.uix.appbar")
+register("FTopAppBarTitle", module="fkivymd.uix.appbar")
+register("FTopAppBarIcon", module="fkivymd.uix.appbar")
+register("FButton", module="fkivymd.uix.button")
+register("FButtonText", module="fkivymd.uix.button")
+register("FButtonIcon", module="fkivymd.uix.button")
+register("FButton2", module="fkivymd.uix.button")
+register("FIconButton", module="fkivymd.uix.button")
+register("FSpeedDialButton", module="fkivymd.uix.button")
+register("FSpeedDialHintText", module="fkivymd.uix.button")
+register("FSpeedDialButtons", module="fkivymd.uix.button")
+register("FFrame", module="fkivymd.uix.card")
+register("FCard", module="fkivymd.uix.card")
+register("FCardSwipe", module="fkivymd.uix.card")
+register("FCardSwipeFront", module="fkivymd.uix.card")
+register("FDialog", module="fkivymd.uix.dialog")
+register("FDialogHeadlineText", module="fkivymd.uix.dialog")
+register("FDialogIcon", module="fkivymd.uix.dialog")
+register("FDialogSupportingText", module="fkivymd.uix.dialog")
+register("FDialogContentContainer", module="fkivymd.uix.dialog")
+register("FDialogButtonContainer", module="fkivymd.uix.dialog")
+register("FDivider", module="fkivymd.uix.divider")
+register("FLabel", module="fkivymd.uix.label")
+register("FIcon", module="fkivymd.uix.label")
+register("FBadge", module="fkivymd.uix.label")
+register("FList", module="fkivymd.uix.list")
+register("FListItem", module="fkivymd.uix.list")
+register("FListItemLeadingAvatar", module="fkivymd.uix.list")
+register("FListItemLeadingText", module="fkivymd.uix.list")
+register("FListLeadingIcon", module="fkivymd.uix.list")
+register("FListItemLeadingThumbnail", module="fkivymd.uix.list")
+register("FListItemHeadlineText", module="fkivymd.uix.list")
+register("FListItemSupportingText", module="fkivymd.uix.list")
+register("FListItemTertiaryText", module="fkivymd.uix.list")
+register("FListItemTrailingText", module="fkivymd.uix.list")
+register("FListItemTrailingCheckBox", module="fkivymd.uix.list")
+register("FListItemTrailingIcon", module="fkivymd.uix.list")
+register("FRecycleList", module="fkivymd.uix.list")
+register("FRecycleListItem", module="fkivymd.uix.list")
+register("FCheckBox", module="fkivymd.uix.selectioncontrol")
+register("FTextField", module="fkivymd.uix.textfield")
+register("FTextFieldLeadingButton", module="fkivymd.uix.textfield")
+register("FTextFieldTrailingButton", module="fkivymd.uix.textfield")
\ No newline at end of file
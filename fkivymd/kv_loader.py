@@ -0,0 +1,350 @@
+"""
+KV Loader
+=========
+
+Every component registers its KV rules here instead of handing them to
+:class:`~kivy.lang.Builder` at import time. The rules of a module are parsed
+the first time an instance of a class defined in that module (or of any
+subclass) is created.
+
+The parsed rules are inserted into ``Builder.rules`` at the position they
+would have had if they were loaded at import time, so rules of the
+application that were loaded earlier still override the library rules.
+
+The parsed and compiled rules are stored in an on-disk cache keyed by the
+hash of the kv source, the Kivy version and the Python bytecode version, so
+the kv sources are only parsed once. The cache is written to the
+``fkivymd/kvcache`` directory of the Kivy home directory of the user
+(``~/.kivy`` on desktop platforms), the entry of a kv source that changed
+replaces the old one.
+
+The ``__kvcache__`` directory of the package is only read, it can be filled
+ahead of time for packaging with::
+
+    python -m fkivymd.precompile
+
+The environment variable ``FKIVYMD_KV_CACHE_DIR`` sets another cache
+directory, ``FKIVYMD_NO_KV_CACHE`` disables the cache. A cache file is only
+loaded if it and its directory belong to the user (or to root) and cannot
+be written by other users, as loading it runs the code it contains.
+
+A kv file is loaded once, even if the module registering it is imported
+again under another name (e.g. ``FKivyMD`` instead of ``fkivymd`` on a
+case-insensitive filesystem) or the application loaded it already. Rules
+that still reach the Builder twice are reported by
+:func:`find_duplicate_rules`, and logged when a class is first created.
+
+.. note:: The following functions are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("register_kv", "load_kv", "precompile_kv", "find_duplicate_rules")
+
+import hashlib
+import marshal
+import os
+import pickle
+import stat
+from contextlib import suppress
+from functools import partial
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+
+import kivy
+from kivy.factory import Factory
+from kivy.lang import Builder, Parser
+from kivy.logger import Logger
+from kivy.resources import resource_find
+
+# Bump when the layout of the cached data changes.
+_CACHE_VERSION = 1
+
+precompiled_dir = os.path.join(os.path.dirname(__file__), "__kvcache__")
+"""Read-only kv cache shipped with the package, see :mod:`fkivymd.precompile`."""
+
+cache_dir = os.environ.get(
+    "FKIVYMD_KV_CACHE_DIR",
+    os.path.join(
+        kivy.kivy_home_dir or os.path.expanduser(os.path.join("~", ".kivy")),
+        "fkivymd",
+        "kvcache",
+    ),
+)
+"""Directory of the kv cache written at runtime."""
+
+use_cache = "FKIVYMD_NO_KV_CACHE" not in os.environ
+"""Whether the kv cache is used."""
+
+
+class _KVEntry:
+    __slots__ = ("modules", "filename", "string", "anchor", "loaded", "ctx")
+
+    def __init__(self, module, filename, string, anchor):
+        # Names of the modules whose classes need the rules: the module
+        # that registered them and the names it was imported again under.
+        self.modules = {module}
+        # Path of the kv file (or pseudo file name of an inline kv string).
+        self.filename = filename
+        # Inline kv string, `None` for kv files.
+        self.string = string
+        # Last rule known to the Builder when the entry was registered.
+        self.anchor = anchor
+        self.loaded = False
+        # Parser context of the loaded rules.
+        self.ctx = None
+
+
+_entries = []
+_loaded_classes = set()
+
+
+def register_kv(module: str, filename: str, string: str | None = None) -> None:
+    """
+    Registers the kv file `filename` (or the kv `string` under the pseudo
+    file name `filename`) for the classes of `module`.
+    """
+
+    for entry in _entries:
+        if entry.string == string and _is_same_file(entry.filename, filename):
+            # The module is imported a second time under another name.
+            Logger.warning(
+                f"FKivyMD: {module} registers the kv rules of "
+                f"{', '.join(sorted(entry.modules))} again, "
+                f"import it as fkivymd"
+            )
+            entry.modules.add(module)
+            return
+
+    _entries.append(
+        _KVEntry(module, filename, string, Builder.rules[-1] if Builder.rules else None)
+    )
+
+
+def load_kv(cls=None) -> None:
+    """
+    Loads the kv rules required by `cls` and its base classes.
+    If `cls` is `None`, all registered kv rules are loaded.
+    """
+
+    if cls in _loaded_classes:
+        return
+
+    modules = None if cls is None else {klass.__module__ for klass in cls.__mro__}
+    for index, entry in enumerate(_entries):
+        if not entry.loaded and (
+            modules is None or not entry.modules.isdisjoint(modules)
+        ):
+            _load_entry(index, entry)
+
+    if cls is not None:
+        _loaded_classes.add(cls)
+        for name, sources in find_duplicate_rules(cls).items():
+            Logger.warning(
+                f"FKivyMD: The rule <{name}> is applied more than once to "
+                f"{cls.__name__}, loaded from {', '.join(sources)}"
+            )
+
+
+def precompile_kv(directory: str | None = None) -> list:
+    """
+    Parses all registered kv rules and stores them in `directory` (the
+    :attr:`precompiled_dir` of the package by default) without loading them
+    into the :class:`~kivy.lang.Builder`.
+    Returns the paths of the written cache files.
+    """
+
+    paths = []
+    for entry in _entries:
+        content, filename = _read_entry(entry)
+        parser = Parser(content=content, filename=filename)
+        path = os.path.join(
+            directory or precompiled_dir, _get_cache_name(content, filename)
+        )
+        # Shipped with the package: readable by every user.
+        if _write_cache(path, parser, 0o644):
+            paths.append(path)
+    return paths
+
+
+def find_duplicate_rules(cls=None) -> dict:
+    """
+    Returns the rules present more than once in the
+    :class:`~kivy.lang.Builder`, because their file was loaded several
+    times, as a dict of the rule names and the `file:line` of the rule.
+    If `cls` is given, only the rules applied to `cls` are returned.
+    """
+
+    names = None if cls is None else {klass.__name__.lower() for klass in cls.__mro__}
+    counts = {}
+    for selector, rule in Builder.rules:
+        key = getattr(selector, "key", None)
+        if names is not None and key not in names:
+            continue
+        # A rule with several selectors is in the Builder once per selector.
+        source = (key, rule.name, _normalize_filename(rule.ctx.filename), rule.line)
+        counts[source] = counts.get(source, 0) + 1
+
+    duplicates = {}
+    for (key, name, filename, line), count in counts.items():
+        if count > 1:
+            duplicates.setdefault(name.strip("<>"), []).append(f"{filename}:{line}")
+    return duplicates
+
+
+def _load_entry(index: int, entry: _KVEntry) -> None:
+    entry.loaded = True
+    content, filename = _read_entry(entry)
+    if any(_is_same_file(filename, x) for x in Builder.files):
+        # Loaded by the application, loading it again doubles every rule.
+        Logger.warning(f"FKivyMD: The kv file {filename} is already loaded, skipped")
+        return
+
+    parser = _get_parser(content, filename)
+    entry.ctx = parser
+
+    insert_index = _get_insert_index(index, entry)
+    Builder.rules[insert_index:insert_index] = parser.rules
+    Builder._clear_matchcache()
+
+    # The same as `Builder.load_string` does with the parsed rules.
+    for name, cls, template in parser.templates:
+        Builder.templates[name] = (cls, template, filename)
+        Factory.register(
+            name, cls=partial(Builder.template, name), is_template=True, warn=True
+        )
+    for name, baseclasses in parser.dynamic_classes.items():
+        Factory.register(name, baseclasses=baseclasses, filename=filename, warn=True)
+    if parser.templates or parser.dynamic_classes or parser.rules:
+        Builder.files.append(filename)
+
+
+def _read_entry(entry: _KVEntry) -> tuple:
+    if entry.string is not None:
+        return entry.string, entry.filename
+
+    filename = resource_find(entry.filename) or entry.filename
+    with open(filename, encoding="utf8") as kv_file:
+        return kv_file.read(), filename
+
+
+def _normalize_filename(filename: str | None) -> str | None:
+    if filename is None or not os.path.isabs(filename):
+        # Pseudo file name of a kv string.
+        return filename
+    return os.path.normcase(os.path.realpath(filename))
+
+
+def _is_same_file(filename: str | None, other: str | None) -> bool:
+    return filename == other or _normalize_filename(filename) == _normalize_filename(other)
+
+
+def _get_parser(content: str, filename: str) -> Parser:
+    if not use_cache:
+        return Parser(content=content, filename=filename)
+
+    name = _get_cache_name(content, filename)
+    for directory in (precompiled_dir, cache_dir):
+        path = os.path.join(directory, name)
+        try:
+            parser = _read_cache(path)
+        except FileNotFoundError:
+            continue
+        except Exception as error:
+            Logger.warning(f"FKivyMD: Invalid kv cache file {path}: {error}")
+            continue
+        # The directives (`#:import`, `#:set`, ...) are executed by the
+        # parser while parsing, they are not part of the cached data.
+        parser.filename = filename
+        parser.execute_directives()
+        return parser
+
+    parser = Parser(content=content, filename=filename)
+    _write_cache(os.path.join(cache_dir, name), parser)
+    return parser
+
+
+def _get_cache_name(content: str, filename: str) -> str:
+    # Paths inside the package are relative, so a precompiled cache stays
+    # valid when the package is moved (e.g. packaged for Android).
+    package_path = os.path.dirname(__file__)
+    if os.path.isabs(filename) and filename.startswith(package_path + os.sep):
+        filename = os.path.relpath(filename, package_path).replace(os.sep, "/")
+
+    # `<source>.<key>.kvc`: the files of a source are found by its prefix
+    # when the source changes.
+    source = hashlib.sha1(filename.encode("utf8")).hexdigest()[:16]
+    key = hashlib.sha1(
+        f"{_CACHE_VERSION}:{kivy.__version__}:{MAGIC_NUMBER.hex()}:"
+        f"{filename}:{content}".encode("utf8")
+    ).hexdigest()
+    return f"{source}.{key}.kvc"
+
+
+def _check_owner(path: str, fd: int) -> None:
+    # Unpickling runs code: refuse files that another user could have written.
+    if not hasattr(os, "getuid"):
+        # Windows: the per-user directories are private by default.
+        return
+    directory = os.path.dirname(path)
+    for item, info in ((path, os.fstat(fd)), (directory, os.stat(directory))):
+        if info.st_uid not in (os.getuid(), 0):
+            raise PermissionError(f"{item} belongs to another user")
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f"{item} is writable by other users")
+
+
+def _read_cache(path: str) -> Parser:
+    with open(path, "rb") as cache_file:
+        _check_owner(path, cache_file.fileno())
+        return pickle.load(cache_file)
+
+
+class _CachePickler(pickle.Pickler):
+    # Compiled kv expressions are code objects, which are not picklable.
+    def reducer_override(self, obj):
+        if isinstance(obj, CodeType):
+            return marshal.loads, (marshal.dumps(obj),)
+        return NotImplemented
+
+
+def _write_cache(path: str, parser: Parser, mode: int = 0o600) -> bool:
+    directory, name = os.path.split(path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # The directories can be listed by whoever can read the files.
+        os.makedirs(directory, mode=mode | (mode & 0o444) >> 2, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as cache_file:
+            _CachePickler(cache_file, pickle.HIGHEST_PROTOCOL).dump(parser)
+        os.replace(tmp_path, path)
+    except Exception as error:
+        # A read-only directory or an unpicklable constant: run uncached.
+        Logger.debug(f"FKivyMD: Cannot write kv cache file {path}: {error}")
+        with suppress(OSError):
+            os.remove(tmp_path)
+        return False
+
+    # Removes the files of the previous versions of the source.
+    source = name.split(".", 1)[0]
+    with suppress(OSError):
+        for other in os.listdir(directory):
+            if (
+                other != name
+                and other.startswith(f"{source}.")
+                and other.endswith(".kvc")
+            ):
+                with suppress(OSError):
+                    os.remove(os.path.join(directory, other))
+    return True
+
+
+def _get_insert_index(index: int, entry: _KVEntry) -> int:
+    # Rules go right after the rules of the entries registered before this
+    # one, or after the rule that was the last one at registration time.
+    previous = [x.ctx for x in _entries[:index] if x.ctx is not None]
+    insert_index = 0
+    for i, item in enumerate(Builder.rules):
+        if item is entry.anchor or any(item[1].ctx is ctx for ctx in previous):
+            insert_index = i + 1
+    return insert_index
@@ -0,0 +1,44 @@
+"""
+Precompile
+==========
+
+Parses the kv rules of all components and stores them in the kv cache
+(see :mod:`fkivymd.kv_loader`), so the application does not have to parse
+them on its first launch. Run it as a packaging step::
+
+    python -m fkivymd.precompile
+    python -m fkivymd.precompile --cache-dir path/to/cache
+
+The cache must be built with the Kivy and Python versions the application
+is shipped with, a cache of other versions is ignored.
+"""
+
+import argparse
+import os
+from importlib import import_module
+
+from fkivymd import kv_loader
+from fkivymd.uix import _components
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m fkivymd.precompile",
+        description="Precompile the kv rules of the fkivymd components.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=kv_loader.precompiled_dir,
+        help="cache directory (default: %(default)s)",
+    )
+    options = parser.parse_args(args)
+    cache_dir = os.path.abspath(options.cache_dir)
+
+    for name in _components:
+        import_module(f"fkivymd.uix.{name}.{name}")
+    paths = kv_loader.precompile_kv(cache_dir)
+    print(f"Precompiled {len(paths)} kv sources into {cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
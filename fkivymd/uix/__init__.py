@@ -0,0 +1,71 @@
+"""
+Components
+==========
+
+The components are imported lazily: a component module (and its kv rules)
+is only loaded when one of its classes is used for the first time::
+
+    from fkivymd.uix import FButton
+    from fkivymd.uix.button import FButton
+"""
+
+from importlib import import_module
+
+_components = {
+    "appbar": ("FTopAppBar", "FTopAppBarTitle", "FTopAppBarIcon"),
+    "button": (
+        "FButton",
+        "FButtonText",
+        "FButtonIcon",
+        "FButton2",
+        "FIconButton",
+        "FSpeedDialButton",
+        "FSpeedDialHintText",
+        "FSpeedDialButtons",
+    ),
+    "card": ("FFrame", "FCard", "FCardSwipe", "FCardSwipeFront"),
+    "dialog": (
+        "FDialog",
+        "FDialogHeadlineText",
+        "FDialogIcon",
+        "FDialogSupportingText",
+        "FDialogContentContainer",
+        "FDialogButtonContainer",
+    ),
+    "divider": ("FDivider",),
+    "label": ("FLabel", "FIcon", "FBadge"),
+    "list": (
+        "FList",
+        "FListItem",
+        "FListItemLeadingAvatar",
+        "FListItemLeadingText",
+        "FListItemLeadingIcon",
+        "FListItemLeadingThumbnail",
+        "FListItemHeadlineText",
+        "FListItemSupportingText",
+        "FListItemTertiaryText",
+        "FListItemTrailingText",
+        "FListItemTrailingCheckBox",
+        "FListItemTrailingIcon",
+        "FRecycleList",
+        "FRecycleListItem",
+    ),
+    "selectioncontrol": ("FCheckBox",),
+    "textfield": ("FTextField", "FTextFieldLeadingButton", "FTextFieldTrailingButton"),
+}
+# Class name -> name of the component package that defines it.
+_classes = {name: package for package, names in _components.items() for name in names}
+
+__all__ = tuple(_classes)
+
+
+def __getattr__(name):
+    if name in _classes:
+        return getattr(import_module(f".{_classes[name]}", __name__), name)
+    if name in _components or name == "behaviors":
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_components})
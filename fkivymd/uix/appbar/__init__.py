@@ -1,5 +1,18 @@
-from .appbar import (
-    FTopAppBar, 
-    FTopAppBarTitle,
-    FTopAppBarIcon
-)
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FTopAppBar",
+    "FTopAppBarTitle",
+    "FTopAppBarIcon",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".appbar", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
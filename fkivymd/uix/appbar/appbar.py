@@ -11,7 +11,6 @@ __all__ = (
 )
 
 import os
-from kivy.lang.builder import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     ColorProperty, 
@@ -25,19 +24,18 @@ from kivymd.uix.behaviors import (
 
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.controllers import WindowController
+from fkivymd.uix.behaviors import FLazyKVBehavior
 from fkivymd.uix.label import FLabel
 from fkivymd.uix.button import FIconButton
 
-from FKivyMD import uix_path
+from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 
-with open(
-    os.path.join(uix_path, "appbar", "appbar.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "appbar", "appbar.kv"))
 
 
 class FTopAppBarIcon(FIconButton):
-    # FKivyMD.uix.appbar.appbar.FTopAppBar object.
+    # fkivymd.uix.appbar.appbar.FTopAppBar object.
     _appbar = ObjectProperty()
 
     md_bg_color_disabled = ColorProperty([0,0,0,0])
@@ -51,11 +49,12 @@ class FTopAppBarIcon(FIconButton):
 
 
 class FTopAppBarTitle(FLabel):
-    # FKivyMD.uix.appbar.appbar.FTopAppBar object.
+    # fkivymd.uix.appbar.appbar.FTopAppBar object.
     _appbar = ObjectProperty()
 
 
 class FTopAppBar(
+    FLazyKVBehavior,
     DeclarativeBehavior,
     ThemableBehavior,
     BackgroundColorBehavior,
@@ -1,4 +1,7 @@
-from .extended_background import ExtendedBackgroundBehavior
-from .elevation import FCommonElevationBehavior
-from .backgroundcolor_behavior import FBackgroundColorBehavior
-from .state_layer_behavior import FStateLayerBehavior
\ No newline at end of file
+from .lazy_kv_behavior import FLazyKVBehavior
+from .extended_background import ExtendedBackgroundBehavior
+from .elevation import FCommonElevationBehavior
+from .backgroundcolor_behavior import FBackgroundColorBehavior
+from .hover_behavior import FHoverBehavior
+from .state_layer_behavior import FStateLayerBehavior
+from .ready_behavior import FReadyBehavior
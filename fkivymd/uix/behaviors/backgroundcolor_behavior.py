@@ -9,70 +9,238 @@ from __future__ import annotations
 
 __all__ = ("FBackgroundColorBehavior",)
 
-from kivy.animation import Animation
-from kivy.lang import Builder
+from kivy.graphics import (
+    Color,
+    Line,
+    Rectangle,
+    SmoothLine,
+    SmoothRoundedRectangle,
+)
 from kivy.properties import (
+    BooleanProperty,
     ColorProperty,
     NumericProperty,
     StringProperty,
     VariableListProperty, 
 )
-from kivy.clock import Clock
+from kivy.uix.relativelayout import RelativeLayout
+from fkivymd.kv_loader import register_kv
+from .lazy_kv_behavior import FLazyKVBehavior
+from .sdf_renderer import SDFRenderer
+from .theme_transition import theme_transition
+
 
-Builder.load_string("""
-#:import RelativeLayout kivy.uix.relativelayout.RelativeLayout
+def _blend_colors(bottom, top) -> list:
+    # One color drawing the same as `top` drawn over `bottom`.
+    top_alpha = top[3]
+    if not top_alpha:
+        return bottom
+    bottom_alpha = bottom[3] * (1 - top_alpha)
+    alpha = top_alpha + bottom_alpha
+    return [
+        (top_value * top_alpha + bottom_value * bottom_alpha) / alpha
+        for top_value, bottom_value in zip(top[:3], bottom[:3])
+    ] + [alpha]
 
 
+# The fill and the outline are added to the group by the behavior, only
+# while they are visible.
+register_kv(__name__, "FBackgroundColorBehavior.kv", """
 <FBackgroundColorBehavior>
+    on_kv_post: self._update_background()
     canvas.before:
-        Color:
-            group: "backgroundcolor-behavior-bg-color"
-            rgba: self._md_bg_color
-        SmoothRoundedRectangle:
-            group: "Background_instruction"
-            size: self.size
-            pos: self.pos if not isinstance(self, RelativeLayout) else (0, 0)
-            # FIXME: Sometimes the radius has the value [], which get a
-            # `GraphicException:
-            #     Invalid radius value, must be list of tuples/numerics` error`
-            radius: self.radius if self.radius else [0, 0, 0, 0]
-            source: self.background
-        Color:
-            rgba: self.line_color
-        SmoothLine:
-            width: root.line_width
-            rounded_rectangle:
-                [ \
-                0,
-                0, \
-                self.width, \
-                self.height, \
-                *self.radius, \
-                ] \
-                if isinstance(self, RelativeLayout) else \
-                [ \
-                self.x,
-                self.y, \
-                self.width, \
-                self.height, \
-                *self.radius, \
-                ]
+        InstructionGroup:
+            group: "backgroundcolor-behavior"
 """)
 
 
-class FBackgroundColorBehavior:
+class FBackgroundColorBehavior(FLazyKVBehavior):
     background = StringProperty()
     radius = VariableListProperty([0], length=4)
     md_bg_color = ColorProperty([0, 0, 0, 0])
     line_color = ColorProperty([0, 0, 0, 0])
     line_width = NumericProperty(1)
+    sdf_renderer = BooleanProperty(False)
+    """
+    Draw the background, the outline, the state layer and the shadow in one
+    quad with a signed distance field shader, instead of one instruction
+    each. The state layer is blended into the background color, as with
+    :attr:`~fkivymd.uix.behaviors.FStateLayerBehavior.state_layer_blend`.
+    Widgets with a :attr:`background` image use the regular instructions, as
+    do all widgets if the shader does not compile.
+
+    :attr:`sdf_renderer` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
 
     _md_bg_color = ColorProperty([0, 0, 0, 0])
+    # State layer color blended into the background, see
+    # `FStateLayerBehavior.state_layer_blend`.
+    _state_layer_tint = ColorProperty([0, 0, 0, 0])
     _shadow_color_ = None
     _first_time = False
+    # Group of the background instructions, the types of the fill and
+    # outline instructions (`None` if not drawn) and the instructions.
+    _background_group = None
+    _background_types = (None, None)
+    _fill_instructions = None
+    _line_instructions = None
+    _sdf_renderer = None
 
     def __init__(self, **kwarg):
         super().__init__(**kwarg)
+        for name in (
+            "_md_bg_color",
+            "_state_layer_tint",
+            "background",
+            "radius",
+            "line_color",
+            "line_width",
+            "sdf_renderer",
+        ):
+            self.fbind(name, self._update_background)
+        # The shadow of `FCommonElevationBehavior`, drawn by the SDF renderer.
+        for name in (
+            "shadow_color",
+            "shadow_offset",
+            "shadow_radius",
+            "shadow_softness",
+            "elevation_level",
+            "elevation_levels",
+        ):
+            if self.property(name, quiet=True) is not None:
+                self.fbind(name, self._update_background_geometry)
+        self.fbind("pos", self._update_background_geometry)
+        self.fbind("size", self._update_background_geometry)
+
+    def _update_background(self, *args) -> None:
+        # Smooth geometry only for rounded corners, no geometry at all for a
+        # transparent fill or outline.
+        if self._background_group is None:
+            # The kv rule adding the group is not applied yet, it updates
+            # the background once it is.
+            if self.canvas is None:
+                return
+            groups = self.canvas.before.get_group("backgroundcolor-behavior")
+            if not groups:
+                return
+            self._background_group = groups[0]
+
+        if self.sdf_renderer and not self.background:
+            if self._sdf_renderer is None:
+                self._sdf_renderer = SDFRenderer.create()
+            if self._sdf_renderer is not None:
+                if self._background_types[0] is not SDFRenderer:
+                    self._background_types = (SDFRenderer, None)
+                    self._background_group.clear()
+                    self._fill_instructions = self._line_instructions = None
+                    self._background_group.add(self._sdf_renderer.context)
+                    self._update_shadow_renderer()
+                self._update_background_geometry()
+                return
+        if self._background_types[0] is SDFRenderer:
+            self._background_types = (None, None)
+            self._background_group.clear()
+            self._update_shadow_renderer()
+
+        rounded = any(self.radius)
+        color = _blend_colors(self._md_bg_color, self._state_layer_tint)
+        types = (
+            (SmoothRoundedRectangle if rounded else Rectangle)
+            if color[3] > 0
+            else None,
+            (SmoothLine if rounded else Line)
+            if self.line_color[3] > 0 and self.line_width > 0
+            else None,
+        )
+        if types != self._background_types:
+            self._background_types = types
+            self._create_background_instructions(*types)
+
+        if self._fill_instructions:
+            fill_color, fill = self._fill_instructions
+            fill_color.rgba = color
+            fill.source = self.background or None
+        if self._line_instructions:
+            line_color, line = self._line_instructions
+            line_color.rgba = self.line_color
+            line.width = self.line_width
+        self._update_background_geometry()
+
+    def _create_background_instructions(self, fill_type, line_type) -> None:
+        group = self._background_group
+        group.clear()
+        self._fill_instructions = self._line_instructions = None
+        if fill_type:
+            self._fill_instructions = Color(), fill_type()
+        if line_type:
+            self._line_instructions = Color(), line_type()
+        for instructions in (self._fill_instructions, self._line_instructions):
+            if instructions:
+                for instruction in instructions:
+                    group.add(instruction)
+
+    def _update_shadow_renderer(self) -> None:
+        # The regular shadow hides itself while the SDF renderer draws it.
+        if hasattr(self, "_trigger_shadow_update"):
+            self._trigger_shadow_update()
+
+    def _update_background_geometry(self, *args) -> None:
+        x, y = self.pos if not isinstance(self, RelativeLayout) else (0, 0)
+        width, height = self.size
+        radius = self.radius if self.radius else [0, 0, 0, 0]
+        if self._background_types[0] is SDFRenderer:
+            self._update_sdf_renderer(x, y, width, height, radius)
+            return
+        if not self._fill_instructions and not self._line_instructions:
+            return
+
+        if self._fill_instructions:
+            fill = self._fill_instructions[1]
+            fill.pos = x, y
+            fill.size = width, height
+            if isinstance(fill, SmoothRoundedRectangle):
+                fill.radius = radius
+        if self._line_instructions:
+            line = self._line_instructions[1]
+            if isinstance(line, SmoothLine):
+                line.rounded_rectangle = [x, y, width, height, *radius]
+            else:
+                line.rectangle = [x, y, width, height]
+
+    def _update_sdf_renderer(self, x, y, width, height, radius) -> None:
+        # Like `kivy.graphics.BoxShadow`, no shadow without blur.
+        if hasattr(self, "elevation_levels") and self.elevation_levels[
+            self.elevation_level
+        ]:
+            shadow_color = self.shadow_color
+            shadow_radius = (
+                radius
+                if self.shadow_radius == [0.0, 0.0, 0.0, 0.0]
+                else self.shadow_radius
+            )
+            shadow_offset = self.shadow_offset
+            shadow_blur = self.elevation_levels[self.elevation_level]
+            shadow_spread = -self.shadow_softness
+        else:
+            shadow_color = (0, 0, 0, 0)
+            shadow_radius = radius
+            shadow_offset = (0, 0)
+            shadow_blur = shadow_spread = 0
+
+        self._sdf_renderer.update(
+            (x, y),
+            (width, height),
+            radius,
+            _blend_colors(self._md_bg_color, self._state_layer_tint),
+            self.line_color,
+            self.line_width if self.line_color[3] > 0 else 0,
+            shadow_color,
+            shadow_radius,
+            shadow_offset,
+            shadow_blur,
+            shadow_spread,
+        )
 
     def on_md_bg_color(self, instance, color: list | str):
         """Fired when the values of :attr:`md_bg_color` change."""
@@ -92,37 +260,37 @@ class FBackgroundColorBehavior:
                 if self.__class__.__name__ != "FSpeedDialButton":
                     self.shadow_color = 0,0,0,0
 
-        def shadow_anim(*args):
-            self.shadow_color = [0,0,0,0]
-            Animation(shadow_color=self._shadow_color_, 
-                    d=self.theme_cls.theme_style_switch_animation_duration, 
-                    t="linear").start(self)
-        
+        duration = (
+            self.theme_cls.theme_style_switch_animation_duration
+            if hasattr(self, "theme_cls")
+            else 0
+        )
+        steps = []
         if (
             hasattr(self, "theme_cls")
             and self.theme_cls.theme_style_switch_animation
             and self.__class__.__name__ != "MDDropdownMenu"
-        ):  
+        ):
             if has_shadow:
-                bg_anim = Animation(
-                    _md_bg_color=color,
-                    shadow_color=[0,0,0,0],
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
+                steps.append(
+                    (duration, {"_md_bg_color": color, "shadow_color": [0, 0, 0, 0]})
                 )
-                bg_anim.bind(on_complete=shadow_anim)
             else:
-                bg_anim = Animation(
-                    _md_bg_color=color,
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
-                )
-            bg_anim.start(self)
-
+                steps.append((duration, {"_md_bg_color": color}))
         else:
+            # A running transition would overwrite the color on its next step.
+            theme_transition.cancel(self, "_md_bg_color")
             self._md_bg_color = color
-            if has_shadow:
-                Clock.schedule_once(shadow_anim)
+
+        if has_shadow:
+            # The shadow fades in again once the background is updated.
+            steps.append((0, {"shadow_color": [0, 0, 0, 0]}))
+            steps.append((duration, {"shadow_color": self._shadow_color_}))
+
+        if steps:
+            theme_transition.animate(self, *steps)
+        else:
+            theme_transition.cancel(self, "shadow_color")
 
         # if (
         #     hasattr(self, "theme_cls")
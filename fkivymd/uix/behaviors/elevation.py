@@ -2,38 +2,54 @@ from __future__ import annotations
 
 __all__ = ("FCommonElevationBehavior",)
 
-from kivy.lang import Builder
+import weakref
+
+from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.properties import (
     BoundedNumericProperty,
     ColorProperty,
     ListProperty,
     NumericProperty,
+    ObjectProperty,
     VariableListProperty,
     DictProperty,
 )
+from fkivymd.kv_loader import register_kv
+from .sdf_renderer import SDFRenderer
+from .shadow_cache import shadow_cache
 
-Builder.load_string(
+register_kv(
+    __name__,
+    "FCommonElevationBehavior.kv",
     """
+#:import RelativeLayout kivy.uix.relativelayout.RelativeLayout
+
+
 <FCommonElevationBehavior>
     canvas.before:
         Color:
             #rgba: self._shadow_color[:3] + [self._shadow_color[3]*(1/(1+100*(.8**((self.opacity-.7)*100))))]
             rgba: self.shadow_color
-        BoxShadow:
-            pos: self.pos if not isinstance(self, RelativeLayout) else (0, 0)
-            size: self.size
-            offset: self.shadow_offset
-            spread_radius: -(self.shadow_softness), -(self.shadow_softness)
-            blur_radius: self.elevation_levels[self.elevation_level]
-            border_radius:
-                (self.radius if hasattr(self, "radius") and self.radius else [0, 0, 0, 0]) \
-                if self.shadow_radius == [0.0, 0.0, 0.0, 0.0] else \
-                self.shadow_radius
+        BorderImage:
+            texture: self._shadow_texture
+            border: self._shadow_border
+            pos:
+                ((0, 0) if isinstance(self, RelativeLayout) else self.pos)[0] \
+                + self._shadow_pos[0], \
+                ((0, 0) if isinstance(self, RelativeLayout) else self.pos)[1] \
+                + self._shadow_pos[1]
+            size: self._shadow_size
 """
 )
 
 
+def _release_shadow_key(holder):
+    if holder[0] is not None:
+        shadow_cache.release(holder[0])
+        holder[0] = None
+
+
 class FCommonElevationBehavior:
     elevation_level = BoundedNumericProperty(0, min=0, max=5)
     """Elevation level (values from 0 to 5)"""
@@ -107,3 +123,68 @@ class FCommonElevationBehavior:
 
     shadow_color = ColorProperty([0, 0, 0, 0.6])
     """Color of the shadow"""
+
+    # Shared shadow texture (see `shadow_cache`) and its geometry relative
+    # to the widget position.
+    _shadow_texture = ObjectProperty(None, allownone=True)
+    _shadow_border = ListProperty([0, 0, 0, 0])
+    _shadow_pos = ListProperty([0, 0])
+    _shadow_size = ListProperty([0, 0])
+
+    # Cache key of the shadow texture in use, in a list shared with the
+    # finalizer that releases it.
+    _shadow_cache_key = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._trigger_shadow_update = Clock.create_trigger(self._update_shadow, -1)
+        for name in (
+            "size",
+            "radius",
+            "shadow_radius",
+            "shadow_offset",
+            "shadow_softness",
+            "elevation_level",
+            "elevation_levels",
+        ):
+            if hasattr(self, name):
+                self.fbind(name, self._trigger_shadow_update)
+        self._trigger_shadow_update()
+
+    def _update_shadow(self, *args) -> None:
+        if getattr(self, "_background_types", (None,))[0] is SDFRenderer:
+            # Drawn by the SDF renderer of `FBackgroundColorBehavior`.
+            if self._shadow_cache_key is not None:
+                _release_shadow_key(self._shadow_cache_key)
+            self._shadow_texture = None
+            self._shadow_size = (0, 0)
+            return
+
+        blur_radius = self.elevation_levels[self.elevation_level]
+        spread_radius = (-self.shadow_softness, -self.shadow_softness)
+        border_radius = (
+            (self.radius if hasattr(self, "radius") and self.radius else [0, 0, 0, 0])
+            if self.shadow_radius == [0.0, 0.0, 0.0, 0.0]
+            else self.shadow_radius
+        )
+        key = shadow_cache.get_key(self.size, blur_radius, spread_radius, border_radius)
+
+        if self._shadow_cache_key is None:
+            self._shadow_cache_key = [None]
+            weakref.finalize(self, _release_shadow_key, self._shadow_cache_key)
+        if key != self._shadow_cache_key[0]:
+            entry = shadow_cache.acquire(key)
+            _release_shadow_key(self._shadow_cache_key)
+            self._shadow_cache_key[0] = key
+            self._shadow_texture = entry.texture
+            self._shadow_border = entry.border
+
+        # The same geometry as `kivy.graphics.BoxShadow` draws.
+        self._shadow_pos = (
+            self.shadow_offset[0] - spread_radius[0] - 1.5 * blur_radius,
+            self.shadow_offset[1] - spread_radius[1] - 1.5 * blur_radius,
+        )
+        self._shadow_size = (
+            max(0, self.width + 2 * spread_radius[0] + 3 * blur_radius),
+            max(0, self.height + 2 * spread_radius[1] + 3 * blur_radius),
+        )
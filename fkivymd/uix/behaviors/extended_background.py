@@ -1,8 +1,8 @@
-from kivy.lang.builder import Builder
 from kivy.properties import NumericProperty, ColorProperty
+from fkivymd.kv_loader import register_kv
 
 
-Builder.load_string('''
+register_kv(__name__, "ExtendedBackgroundBehavior.kv", '''
 <ExtendedBackgroundBehavior>:
     _canvas_height: self.height
     canvas.before:
@@ -0,0 +1,316 @@
+"""
+Behaviors/Hover
+===============
+
+Hover events of the fkivymd widgets, dispatched by one
+:class:`HoverManager` for the whole window instead of every widget checking
+every mouse move.
+
+The manager keeps the window boxes of the hoverable widgets in a uniform
+grid of :attr:`HoverManager.cell_size` cells. A mouse move only hit-tests
+the widgets of the cell under the cursor. The boxes are updated lazily, on
+the next mouse move after a widget moved or was resized; a move of a
+relative layout, scroll view or scatter the widgets are in updates all of
+them. Widgets not on the window are indexed on the first mouse move after
+they are, widgets removed from the window with their parent are dropped
+from the grid when the cursor reaches them.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("FHoverBehavior", "HoverManager", "hover_manager")
+
+from weakref import WeakKeyDictionary, WeakSet
+
+from kivy.metrics import dp
+from kivy.properties import BooleanProperty, ObjectProperty
+from kivy.uix.widget import Widget
+
+# Properties of the widgets that transform the coordinates of their
+# children, moving them on the window without changing their `pos`.
+_transform_properties = ("pos", "size", "scroll_x", "scroll_y", "transform")
+
+
+def _transforms_children(widget) -> bool:
+    return type(widget).to_parent is not Widget.to_parent
+
+
+def _is_visible(widget, pos) -> bool:
+    # The same check as `kivymd.uix.behaviors.HoverBehavior`: the cursor is
+    # inside all the parents and not over a sibling drawn above.
+    x, y = pos
+    while True:
+        parent = widget.parent
+        if not parent:
+            break
+        try:
+            parent_x, parent_y = parent.to_window(*parent.pos)
+        except Exception:
+            break
+        if not (
+            parent_x <= x <= parent_x + parent.width
+            and parent_y <= y <= parent_y + parent.height
+        ):
+            return False
+        widget = parent
+
+    parent = widget.parent
+    if parent:
+        for child in parent.children:
+            if child is widget:
+                break
+            if isinstance(child, Widget):
+                child_x, child_y = child.to_window(*child.pos)
+                if (
+                    child_x <= x <= child_x + child.width
+                    and child_y <= y <= child_y + child.height
+                ):
+                    return False
+    return True
+
+
+class HoverManager:
+    cell_size = dp(100)
+    """Size of the cells of the grid."""
+
+    max_cells = 64
+    """
+    Number of cells above which a widget is not put in the grid but tested
+    on every mouse move.
+    """
+
+    def __init__(self):
+        self._widgets = WeakSet()
+        # Widgets whose box must be updated, all of them if `_update_all`.
+        self._dirty = WeakSet()
+        self._update_all = False
+        # Grid cell -> widgets with a box overlapping the cell.
+        self._cells = {}
+        # Widget -> (window box, cells of the widget).
+        self._boxes = WeakKeyDictionary()
+        # Widgets too large for the grid.
+        self._large = WeakSet()
+        self._hovered = WeakSet()
+        # Transforming parents whose changes update all the boxes.
+        self._watched = WeakSet()
+        self._window = None
+
+    def add(self, widget) -> None:
+        """Dispatches the hover events of `widget` from now on."""
+
+        if self._window is None:
+            from kivy.core.window import Window
+
+            self._window = Window
+            Window.bind(mouse_pos=self._on_mouse_pos)
+
+        self._widgets.add(widget)
+        self._dirty.add(widget)
+        for name in ("pos", "size", "parent"):
+            widget.fbind(name, self._on_widget_changed)
+
+    def remove(self, widget) -> None:
+        """Stops dispatching the hover events of `widget`."""
+
+        for name in ("pos", "size", "parent"):
+            widget.funbind(name, self._on_widget_changed)
+        self._unindex(widget)
+        self._widgets.discard(widget)
+        self._dirty.discard(widget)
+        self._hovered.discard(widget)
+
+    def get_candidates(self, pos) -> set:
+        """Returns the widgets whose box may contain `pos`."""
+
+        self._update()
+        candidates = set(self._large)
+        cell = self._cells.get(self._get_cell(*pos))
+        if cell:
+            candidates.update(cell)
+        return candidates
+
+    def _on_widget_changed(self, widget, *args) -> None:
+        self._dirty.add(widget)
+
+    def _on_transform_changed(self, *args) -> None:
+        self._update_all = True
+
+    def _on_mouse_pos(self, window, pos) -> None:
+        x, y = pos
+        hits = []
+        for widget in self.get_candidates(pos):
+            if not widget.allow_hover:
+                continue
+            box = self._boxes.get(widget)
+            if not (
+                box and box[0][0] <= x <= box[0][2] and box[0][1] <= y <= box[0][3]
+            ):
+                continue
+            # The box of a widget removed from the window with its parent,
+            # or moved with an ancestor that is not watched, is outdated.
+            if not widget.get_root_window():
+                self._unindex(widget)
+                self._dirty.add(widget)
+                continue
+            live_box = self._get_box(widget)
+            if live_box != box[0]:
+                self._unindex(widget)
+                self._index(widget)
+            left, bottom, right, top = live_box
+            if left <= x <= right and bottom <= y <= top:
+                hits.append(widget)
+
+        for widget in list(self._hovered):
+            if widget not in hits:
+                self._hovered.discard(widget)
+                widget._leave()
+        for widget in hits:
+            if widget not in self._hovered:
+                self._hovered.add(widget)
+                widget._enter(pos)
+
+    def _update(self) -> None:
+        if self._update_all:
+            self._update_all = False
+            widgets = list(self._widgets)
+        elif self._dirty:
+            widgets = list(self._dirty)
+        else:
+            return
+        self._dirty.clear()
+        for widget in widgets:
+            self._unindex(widget)
+            if not self._index(widget):
+                # Not on the window (yet): an ancestor may be added to it
+                # without the widget changing, try again on the next move.
+                self._dirty.add(widget)
+
+    def _index(self, widget) -> bool:
+        # Returns whether the widget is on the window and was indexed.
+        if not widget.get_root_window():
+            return False
+
+        parent = widget.parent
+        while parent is not None and parent is not self._window:
+            if _transforms_children(parent) and parent not in self._watched:
+                self._watched.add(parent)
+                for name in _transform_properties:
+                    if parent.property(name, quiet=True) is not None:
+                        parent.fbind(name, self._on_transform_changed)
+            parent = parent.parent
+
+        x, y, right, top = self._get_box(widget)
+        left_cell, bottom_cell = self._get_cell(x, y)
+        right_cell, top_cell = self._get_cell(right, top)
+        cells = [
+            (col, row)
+            for col in range(left_cell, right_cell + 1)
+            for row in range(bottom_cell, top_cell + 1)
+        ]
+        if len(cells) > self.max_cells:
+            self._large.add(widget)
+            cells = []
+        for cell in cells:
+            widgets = self._cells.get(cell)
+            if widgets is None:
+                widgets = self._cells[cell] = WeakSet()
+            widgets.add(widget)
+        self._boxes[widget] = ((x, y, right, top), cells)
+        return True
+
+    def _unindex(self, widget) -> None:
+        box = self._boxes.pop(widget, None)
+        if box is None:
+            return
+        self._large.discard(widget)
+        for cell in box[1]:
+            widgets = self._cells.get(cell)
+            if widgets is not None:
+                widgets.discard(widget)
+                if not widgets:
+                    del self._cells[cell]
+
+    def _get_box(self, widget) -> tuple:
+        x, y = widget.to_window(*widget.pos)
+        return x, y, x + widget.width, y + widget.height
+
+    def _get_cell(self, x, y) -> tuple:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+
+hover_manager = HoverManager()
+
+
+class FHoverBehavior:
+    """
+    Dispatches `on_enter` and `on_leave` when the mouse enters and leaves the
+    widget, like :class:`~kivymd.uix.behaviors.HoverBehavior`.
+
+    :Events:
+        :attr:`on_enter`
+            Fired when mouse enters the bbox of the widget and the widget is
+            visible.
+        :attr:`on_leave`
+            Fired when the mouse exits the widget and the widget is visible.
+    """
+
+    hovering = BooleanProperty(False)
+    """
+    `True`, if the mouse cursor is within the borders of the widget.
+
+    :attr:`hovering` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    hover_visible = BooleanProperty(False)
+    """
+    `True` if hovering is `True` and the widget is visible.
+
+    :attr:`hover_visible` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    enter_point = ObjectProperty(allownone=True)
+    """
+    Holds the last position where the mouse pointer crossed into the widget
+    if the widget is visible and is currently in a hovering state.
+
+    :attr:`enter_point` is a :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    allow_hover = BooleanProperty(True)
+    """
+    Whether to use hover behavior.
+
+    :attr:`allow_hover` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `True`.
+    """
+
+    __events__ = ("on_enter", "on_leave")
+
+    def __init__(self, *args, **kwargs):
+        hover_manager.add(self)
+        super().__init__(*args, **kwargs)
+
+    def on_enter(self):
+        """Fired when mouse enter the bbox of the widget."""
+
+    def on_leave(self):
+        """Fired when the mouse goes outside the widget border."""
+
+    def _enter(self, pos) -> None:
+        self.hovering = True
+        self.hover_visible = _is_visible(self, pos)
+        if self.hover_visible:
+            self.enter_point = pos
+            self.dispatch("on_enter")
+
+    def _leave(self) -> None:
+        self.hovering = False
+        self.enter_point = None
+        if self.hover_visible:
+            self.hover_visible = False
+            self.dispatch("on_leave")
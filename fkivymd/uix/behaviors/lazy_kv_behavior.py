@@ -0,0 +1,18 @@
+"""
+Behaviors/Lazy KV
+=================
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+__all__ = ("FLazyKVBehavior",)
+
+from fkivymd.kv_loader import load_kv
+
+
+class FLazyKVBehavior:
+    """Loads the kv rules of the widget class before they are applied."""
+
+    def __init__(self, *args, **kwargs):
+        load_kv(self.__class__)
+        super().__init__(*args, **kwargs)
@@ -0,0 +1,94 @@
+"""
+Behaviors/Ready
+===============
+
+Dispatches the `on_ready` event of a widget once its kv rules are applied
+and it has a parent. The ready widgets are collected and dispatched by one
+clock trigger that runs before the next frame is drawn, so the work done in
+`on_ready` (positions taken from the layout, label textures, ...) is part of
+the first frame instead of moving the widget a few frames later.
+
+A widget whose labels (children or kv ids) still have a texture update
+queued for the frame is dispatched by a later run of the pass, once the
+textures are rendered.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+__all__ = ("FReadyBehavior",)
+
+from itertools import chain
+
+from kivy.clock import Clock
+from kivy.properties import BooleanProperty
+
+# FReadyBehavior objects waiting for the ready pass, in the order they
+# became ready.
+_pending = {}
+
+
+def _has_pending_texture(widget) -> bool:
+    for item in chain(widget.walk(restrict=True), widget.ids.values()):
+        trigger = getattr(item, "_trigger_texture", None)
+        # Only the triggers run before the frame, like this pass.
+        if trigger is not None and trigger.is_triggered and trigger.timeout < 0:
+            return True
+    return False
+
+
+def _dispatch_ready(*args):
+    # Like the layout pass of the buttons, the trigger runs again in the
+    # same frame if widgets become ready meanwhile.
+    widgets = tuple(_pending)
+    _pending.clear()
+    for widget in widgets:
+        if _has_pending_texture(widget):
+            # The texture triggers are queued, they run before the next
+            # run of this pass.
+            _pending[widget] = None
+            continue
+        widget.is_ready = True
+        widget.dispatch("on_ready")
+    if _pending:
+        _trigger_ready_pass()
+
+
+_trigger_ready_pass = Clock.create_trigger(_dispatch_ready, -1)
+
+
+class FReadyBehavior:
+    is_ready = BooleanProperty(False)
+    """
+    Whether `on_ready` was dispatched.
+
+    :attr:`is_ready` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    _kv_applied = False
+
+    __events__ = ("on_ready",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fbind("parent", self._check_ready)
+
+    def on_kv_post(self, base_widget):
+        super().on_kv_post(base_widget)
+        self._kv_applied = True
+        self._check_ready()
+
+    def on_ready(self, *args) -> None:
+        """
+        Fired once, before the first frame showing the widget is drawn.
+        """
+
+    def _check_ready(self, *args) -> None:
+        if (
+            not self.is_ready
+            and self._kv_applied
+            and self.parent is not None
+            and self not in _pending
+        ):
+            _pending[self] = None
+            _trigger_ready_pass()
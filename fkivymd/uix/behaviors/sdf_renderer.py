@@ -0,0 +1,165 @@
+"""
+Behaviors/SDF Renderer
+======================
+
+Draws the background, the outline, the state layer and the shadow of a
+widget in one quad, with a fragment shader computing the signed distance to
+the rounded box of the widget. Used by
+:class:`~fkivymd.uix.behaviors.FBackgroundColorBehavior` when
+:attr:`~fkivymd.uix.behaviors.FBackgroundColorBehavior.sdf_renderer` is
+`True`.
+
+The shadow has the falloff of :class:`~kivy.graphics.BoxShadow`, computed
+for every pixel instead of drawn from a cached texture.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("SDFRenderer",)
+
+from kivy.graphics import Color, Rectangle, RenderContext
+from kivy.logger import Logger
+
+FRAGMENT_SHADER = """
+$HEADER$
+
+uniform vec2 quad_size;
+uniform vec2 box_pos;
+uniform vec2 box_size;
+// Top left, top right, bottom right, bottom left.
+uniform vec4 radius;
+uniform vec4 bg_color;
+uniform vec4 line_color;
+uniform float line_width;
+uniform vec4 shadow_color;
+uniform vec4 shadow_radius;
+uniform vec2 shadow_offset;
+uniform float shadow_blur;
+uniform float shadow_spread;
+
+float rounded_box(vec2 p, vec2 half_size, vec4 r) {
+    float corner = p.x < 0.0 ? (p.y > 0.0 ? r.x : r.w) : (p.y > 0.0 ? r.y : r.z);
+    corner = min(corner, min(half_size.x, half_size.y));
+    vec2 q = abs(p) - half_size + corner;
+    return min(max(q.x, q.y), 0.0) + length(max(q, 0.0)) - corner;
+}
+
+vec4 over(vec4 top, float coverage, vec4 bottom) {
+    // Premultiplied `bottom`, straight `top`.
+    float alpha = top.a * coverage;
+    return vec4(top.rgb * alpha, alpha) + bottom * (1.0 - alpha);
+}
+
+void main(void) {
+    vec2 half_size = box_size * 0.5;
+    vec2 p = tex_coord0 * quad_size - box_pos - half_size;
+    float d = rounded_box(p, half_size, radius);
+
+    vec4 color = vec4(0.0);
+    if (shadow_color.a > 0.0) {
+        // The falloff of `kivy.graphics.BoxShadow`.
+        float shadow_d = rounded_box(
+            p - shadow_offset,
+            max(half_size + shadow_spread - 2.0, vec2(0.0)),
+            shadow_radius
+        );
+        float falloff = 1.0 / (1.0 + exp(-shadow_d / (max(1.0, shadow_blur) / 4.0)));
+        color = over(shadow_color, min(1.0, 2.0 * (1.0 - falloff)), color);
+    }
+    color = over(bg_color, clamp(0.5 - d, 0.0, 1.0), color);
+    if (line_width > 0.0) {
+        color = over(
+            line_color, clamp(line_width * 0.5 + 0.5 - abs(d), 0.0, 1.0), color
+        );
+    }
+
+    if (color.a > 0.0) {
+        color.rgb /= color.a;
+    }
+    gl_FragColor = frag_color * color;
+}
+"""
+
+# Set when the shader does not compile, the widgets then use the regular
+# instructions.
+_unsupported = False
+
+
+class SDFRenderer:
+    """The render context and the quad of one widget."""
+
+    def __init__(self):
+        self.context = RenderContext(
+            use_parent_projection=True,
+            use_parent_modelview=True,
+            use_parent_frag_modelview=True,
+        )
+        self.context.shader.fs = FRAGMENT_SHADER
+        with self.context:
+            Color(1, 1, 1, 1)
+            # `tex_coord0` is the position in the quad, from the bottom left.
+            self.rectangle = Rectangle(tex_coords=(0, 0, 1, 0, 1, 1, 0, 1))
+
+    @staticmethod
+    def create() -> SDFRenderer | None:
+        """Returns a renderer, or `None` if the shader is not supported."""
+
+        global _unsupported
+
+        if _unsupported:
+            return None
+        renderer = SDFRenderer()
+        if not renderer.context.shader.success:
+            _unsupported = True
+            Logger.warning(
+                "FKivyMD: The SDF renderer shader does not compile, "
+                "the regular instructions are used"
+            )
+            return None
+        return renderer
+
+    def update(
+        self,
+        pos: tuple,
+        size: tuple,
+        radius: list,
+        bg_color: list,
+        line_color: list,
+        line_width: float,
+        shadow_color: list,
+        shadow_radius: list,
+        shadow_offset: tuple,
+        shadow_blur: float,
+        shadow_spread: float,
+    ) -> None:
+        """Sets the geometry and the uniforms."""
+
+        # The quad covers the shadow and the outline around the box.
+        margin = (
+            1.5 * shadow_blur
+            + max(0.0, shadow_spread)
+            + max(abs(shadow_offset[0]), abs(shadow_offset[1]))
+            + line_width
+            + 1
+            if shadow_color[3] > 0
+            else line_width + 1
+        )
+        quad_size = (size[0] + 2 * margin, size[1] + 2 * margin)
+        self.rectangle.pos = (pos[0] - margin, pos[1] - margin)
+        self.rectangle.size = quad_size
+
+        context = self.context
+        context["quad_size"] = [float(x) for x in quad_size]
+        context["box_pos"] = [float(margin), float(margin)]
+        context["box_size"] = [float(x) for x in size]
+        context["radius"] = [float(x) for x in radius]
+        context["bg_color"] = [float(x) for x in bg_color]
+        context["line_color"] = [float(x) for x in line_color]
+        context["line_width"] = float(line_width)
+        context["shadow_color"] = [float(x) for x in shadow_color]
+        context["shadow_radius"] = [float(x) for x in shadow_radius]
+        context["shadow_offset"] = [float(x) for x in shadow_offset]
+        context["shadow_blur"] = float(shadow_blur)
+        context["shadow_spread"] = float(shadow_spread)
@@ -0,0 +1,190 @@
+"""
+Behaviors/Shadow Cache
+======================
+
+Process-wide cache of rendered shadow textures. Widgets whose shadows have
+the same blur radius, spread radius and corner radii share one texture
+instead of each rendering its own :class:`~kivy.graphics.BoxShadow`.
+
+The textures are rendered at the smallest size that still contains the
+corners and the blurred edges of the shadow, and are drawn nine-patch style
+with a :class:`~kivy.graphics.BorderImage`, so one texture serves shadows
+of any size. Shadows too small to stretch are rendered at their size,
+rounded up to :attr:`ShadowCache.size_step`.
+
+The textures are rendered white and tinted with the shadow color when they
+are drawn. They are reference counted by the widgets that show them;
+textures no longer shown are kept for reuse and evicted least recently
+used first.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("ShadowCache", "shadow_cache")
+
+import math
+from collections import OrderedDict
+
+from kivy.clock import Clock
+from kivy.graphics import BoxShadow, ClearBuffers, ClearColor, Color, Fbo
+
+
+def _get_border(blur_radius: float, border_radius: tuple) -> list:
+    # Distance from the shadow edges to the part of the shadow that is the
+    # same all along an edge: the blur outside and inside the box, the
+    # corner radius and the antialiased edge. In the (bottom, right, top,
+    # left) order of `kivy.graphics.BorderImage.border`.
+    top_left, top_right, bottom_right, bottom_left = border_radius
+    edge = 3 * blur_radius + 2
+    return [
+        edge + max(bottom_left, bottom_right),
+        edge + max(top_right, bottom_right),
+        edge + max(top_left, top_right),
+        edge + max(top_left, bottom_left),
+    ]
+
+
+def _get_min_size(
+    blur_radius: float, spread_radius: tuple, border_radius: tuple
+) -> tuple:
+    # Smallest shadow size with a stretchable middle. The box must also be
+    # large enough for the corner radii, which are clamped on smaller boxes.
+    border = _get_border(blur_radius, border_radius)
+    box = 3 * blur_radius + 2 * max(border_radius)
+    return (
+        math.ceil(max(border[1] + border[3], box + 2 * abs(spread_radius[0]))) + 2,
+        math.ceil(max(border[0] + border[2], box + 2 * abs(spread_radius[1]))) + 2,
+    )
+
+
+class _ShadowCacheEntry:
+    __slots__ = ("fbo", "texture", "border", "refcount", "__weakref__")
+
+    def __init__(self, fbo, border):
+        self.fbo = fbo
+        self.texture = fbo.texture
+        # Nine-patch border of the texture.
+        self.border = border
+        self.refcount = 1
+        # The texture content is lost with the GL context.
+        fbo.add_reload_observer(self._on_reload)
+
+    def _on_reload(self, *args):
+        Clock.schedule_once(lambda dt: self.fbo.draw())
+
+
+class ShadowCache:
+    max_unused = 64
+    """Number of textures kept while no widget shows them."""
+
+    size_step = 4
+    """Rounding of the size of the shadows too small to stretch."""
+
+    def __init__(self):
+        self._entries = {}
+        # Entries without references, least recently used first.
+        self._unused = OrderedDict()
+
+    def get_key(
+        self,
+        size: tuple,
+        blur_radius: float,
+        spread_radius: tuple,
+        border_radius: tuple,
+    ) -> tuple:
+        """
+        Returns the cache key of the shadow of a box of `size`. The key is
+        the same for all boxes whose shadows can be drawn from the same
+        texture.
+        """
+
+        blur = round(blur_radius, 1)
+        spread = tuple(round(x, 1) for x in spread_radius)
+        radius = tuple(round(x, 1) for x in border_radius)
+        min_size = _get_min_size(blur, spread, radius)
+        # Each axis is either stretched (`None`) or rendered at its size.
+        buckets = tuple(
+            None if shadow_size >= min_shadow_size else self._get_bucket(shadow_size)
+            for shadow_size, min_shadow_size in zip(
+                (
+                    size[0] + 2 * spread[0] + 3 * blur,
+                    size[1] + 2 * spread[1] + 3 * blur,
+                ),
+                min_size,
+            )
+        )
+        return buckets, blur, spread, radius
+
+    def acquire(self, key: tuple) -> _ShadowCacheEntry:
+        """Returns the entry of `key` with a new reference."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = self._render(key)
+        else:
+            if not entry.refcount:
+                del self._unused[key]
+            entry.refcount += 1
+        return entry
+
+    def release(self, key: tuple) -> None:
+        """Releases a reference to the texture of `key`."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.refcount -= 1
+        if not entry.refcount:
+            self._unused[key] = entry
+            while len(self._unused) > self.max_unused:
+                old_key, _ = self._unused.popitem(last=False)
+                del self._entries[old_key]
+
+    def clear(self) -> None:
+        """Removes the textures no widget shows."""
+
+        for key in self._unused:
+            del self._entries[key]
+        self._unused.clear()
+
+    def _get_bucket(self, value: float) -> int:
+        return max(1, math.ceil(value / self.size_step)) * self.size_step
+
+    def _render(self, key: tuple) -> _ShadowCacheEntry:
+        (width, height), blur, spread_radius, radius = key
+        border = _get_border(blur, radius)
+        min_width, min_height = _get_min_size(blur, spread_radius, radius)
+        if width is None:
+            width = min_width
+        else:
+            border[1] = border[3] = 0
+        if height is None:
+            height = min_height
+        else:
+            border[0] = border[2] = 0
+
+        fbo = Fbo(size=(width, height), with_stencilbuffer=False)
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Color(1, 1, 1, 1)
+            BoxShadow(
+                pos=(
+                    1.5 * blur + spread_radius[0],
+                    1.5 * blur + spread_radius[1],
+                ),
+                size=(
+                    width - 3 * blur - 2 * spread_radius[0],
+                    height - 3 * blur - 2 * spread_radius[1],
+                ),
+                blur_radius=blur,
+                spread_radius=spread_radius,
+                border_radius=radius,
+            )
+        fbo.draw()
+        return _ShadowCacheEntry(fbo, tuple(border))
+
+
+shadow_cache = ShadowCache()
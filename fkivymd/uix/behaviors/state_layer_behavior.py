@@ -1,92 +1,152 @@
 from kivy import platform
 from kivy.clock import Clock
-from kivy.lang import Builder
+from kivy.graphics import Color, InstructionGroup, RoundedRectangle
 from kivy.properties import ColorProperty, NumericProperty, BooleanProperty
-from kivymd.uix.behaviors.focus_behavior import FocusBehavior
+from fkivymd.uix.behaviors.hover_behavior import FHoverBehavior
 
-Builder.load_string(
-    """
-<FStateLayerBehavior>
-    canvas.after:
-        Color
-            rgba: self.state_layer_color
-        RoundedRectangle:
-            group: "State_layer_instruction"
-            size: self.size if self.state_effect else [0, 0]
-            pos: self.pos
-            radius: self.radius if hasattr(self, "radius") else [0, ]
-""",
-    filename="FStateLayerBehavior.kv",
-)
-
-class FStateLayerBehavior(FocusBehavior):
+# Opacities of the disabled state of each state layer role. A dict value
+# maps the `style` of the widget to the opacity.
+_disabled_opacities = {
+    "FBaseButton": {
+        "disabled_bg_opacity": 0.4,
+        "disabled_line_opacity": 0.4,
+        "disabled_fg_opacity": 0.4,
+    },
+    "FIconButton": {
+        "disabled_bg_opacity": 0.4,
+        "disabled_line_opacity": 0.4,
+        "disabled_fg_opacity": 0.4,
+    },
+    "FSpeedDialButton": {
+        "disabled_bg_opacity": 0.4,
+        "disabled_line_opacity": 0.4,
+        "disabled_fg_opacity": 0.4,
+    },
+    "FFrame": {"disabled_bg_opacity": {"outlined": 0.12, None: 0.38}},
+    "FCard": {"disabled_bg_opacity": {"outlined": 0.12, None: 0.38}},
+    "FLabel": {"disabled_fg_opacity": 0.38},
+    "FIcon": {"disabled_fg_opacity": 0.38},
+    "FListItem": {
+        "disabled_bg_opacity": 0.38,
+        "disabled_leading_avatar_opacity": 0.38,
+    },
+    "FCheckBox": {"disabled_bg_opacity": 0.38},
+}
+
+
+class FStateLayerBehavior(FHoverBehavior):
+    # State layer role of the widget: the name of the component class whose
+    # colors and opacities the state layer uses. Every component class
+    # declares its role, subclasses inherit it.
     _state_widget = None
+    # Focus properties of `kivymd.uix.behaviors.StateFocusBehavior`.
+    focus_behavior = BooleanProperty(True)
+    focus_color = ColorProperty(None)
+    unfocus_color = ColorProperty(None)
     state_layer_color = ColorProperty([0, 0, 0, 0])
     state_hover = NumericProperty(0.07)
     state_press = NumericProperty(0.11)
     state_drag = NumericProperty(0.16)
     state_effect = BooleanProperty(True)
+    state_layer_blend = BooleanProperty(False)
+    """
+    Blend the state layer color into the background color instead of
+    drawing the state layer over the widget, so each widget draws one
+    rectangle. The state layer then tints the background but not the
+    content of the widget. Widgets without a background color or with a
+    :attr:`background` image draw the state layer over the widget.
+
+    :attr:`state_layer_blend` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _state = 0.0
     _bg_color = (0, 0, 0, 0)
     _is_already_disabled = False
     _shadow_softness = [0, 0]
     _elevation_level = 0
+    # Group, color and rectangle of the state layer drawn over the widget,
+    # only in `canvas.after` while the state layer is visible.
+    _state_layer_instructions = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._state_widget = self.get_root_widget()
+        for name in (
+            "state_layer_color",
+            "state_effect",
+            "state_layer_blend",
+            "sdf_renderer",
+            "background",
+            "_md_bg_color",
+        ):
+            if self.property(name, quiet=True) is not None:
+                self.fbind(name, self._update_state_layer)
+        self._update_state_layer()
         self.add_attr(self._state_widget)
-        if hasattr(self, "style"):
+        if any(
+            isinstance(opacity, dict)
+            for opacity in _disabled_opacities.get(self._state_widget, {}).values()
+        ):
             self.bind(style=lambda *x: self.add_attr(self._state_widget))
 
     def get_root_widget(self):
-        _widgets = [
-            ('FBaseButton', 'button.button'), 
-            ('FIconButton', 'button'), 
-            ('FSpeedDialButton', 'button'),
-            ('FCard', 'card'),
-            ('FFrame', 'card'),
-            ('FLabel', 'label'), 
-            ('FIcon', 'label'),
-            ('FListItem', 'list'), 
-            ('FCheckBox', 'selectioncontrol'),
-            ]
-        widgets = (i for i in _widgets)
-        del _widgets
-        
-        def check(widget):
-            exec(f"from fkivymd.uix.{widget[1]} import {widget[0]}")
-            widget_ = eval(f"{widget[0]}")
-            if isinstance(self, widget_):
-                return widget[0]
-            
-            try:
-                return check(next(widgets))
-            except StopIteration:
-                pass
-        
-        return check(next(widgets))
-    
-    def add_attr(self, widget):
-        if not widget:
-            return
+        """Returns the state layer role of the widget."""
+
+        return self._state_widget
 
-        if widget in ["FBaseButton", "FIconButton", "FSpeedDialButton"]:
-            self.disabled_bg_opacity = 0.4
-            self.disabled_line_opacity = 0.4
-            self.disabled_fg_opacity = 0.4
+    def _update_state_layer(self, *args) -> None:
+        color = self.state_layer_color
+        visible = self.state_effect and color[3] > 0
+        blend = (
+            visible
+            and (self.state_layer_blend or getattr(self, "sdf_renderer", False))
+            and hasattr(self, "_state_layer_tint")
+            and not self.background
+            and self._md_bg_color[3] > 0
+        )
+        if hasattr(self, "_state_layer_tint"):
+            self._state_layer_tint = color if blend else (0, 0, 0, 0)
 
-        elif widget in ["FFrame", "FCard"]:
-            self.disabled_bg_opacity = 0.12 if self.style == "outlined" else 0.38
+        instructions = self._state_layer_instructions
+        if visible and not blend:
+            if instructions is None:
+                self._add_state_layer_instructions()
+            else:
+                instructions[1].rgba = color
+        elif instructions is not None:
+            self.canvas.after.remove(instructions[0])
+            self._state_layer_instructions = None
+            for name in ("pos", "size", "radius"):
+                if self.property(name, quiet=True) is not None:
+                    self.funbind(name, self._update_state_layer_rectangle)
+
+    def _add_state_layer_instructions(self) -> None:
+        group = InstructionGroup()
+        color = Color(rgba=self.state_layer_color)
+        rectangle = RoundedRectangle(group="State_layer_instruction")
+        group.add(color)
+        group.add(rectangle)
+        self.canvas.after.add(group)
+        self._state_layer_instructions = group, color, rectangle
+        for name in ("pos", "size", "radius"):
+            if self.property(name, quiet=True) is not None:
+                self.fbind(name, self._update_state_layer_rectangle)
+        self._update_state_layer_rectangle()
 
-        elif self._state_widget in ["FLabel", "FIcon"]:
-            self.disabled_fg_opacity = 0.38
+    def _update_state_layer_rectangle(self, *args) -> None:
+        rectangle = self._state_layer_instructions[2]
+        rectangle.pos = self.pos
+        rectangle.size = self.size
+        rectangle.radius = self.radius if hasattr(self, "radius") else [0]
 
-        elif widget == "FListItem":
-            self.disabled_bg_opacity = 0.38
-            self.disabled_leading_avatar_opacity = 0.38
+    def add_attr(self, widget):
+        if not widget:
+            return
 
-        elif widget == "FCheckBox":
-            self.disabled_bg_opacity = 0.38
+        for name, opacity in _disabled_opacities.get(widget, {}).items():
+            if isinstance(opacity, dict):
+                opacity = opacity.get(self.style, opacity[None])
+            setattr(self, name, opacity)
 
     def set_properties_widget(self) -> None:
         """Fired `on_release/on_press/on_enter/on_leave` events."""
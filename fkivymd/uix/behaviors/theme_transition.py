@@ -0,0 +1,181 @@
+"""
+Behaviors/Theme Transition
+==========================
+
+Drives the color transitions of a theme style switch. All widgets register
+their transitions with a single driver that interpolates them from one
+clock event per frame, instead of every widget starting its own
+:class:`~kivy.animation.Animation`.
+
+A transition is a sequence of steps, each a duration and the final values
+of the properties it changes. The values are interpolated linearly from the
+values the properties have when the step begins.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("ThemeTransition", "theme_transition")
+
+from weakref import WeakKeyDictionary
+
+from kivy.clock import Clock
+
+
+class _Transition:
+    __slots__ = ("steps", "names", "start_values", "elapsed")
+
+    def __init__(self, steps):
+        # Remaining steps, the first one is running.
+        self.steps = list(steps)
+        # Properties changed by the steps.
+        self.names = {name for _, values in steps for name in values}
+        # Values of the properties when the running step began, `None`
+        # until the step begins.
+        self.start_values = None
+        self.elapsed = 0
+
+
+def _interpolate(start, end, progress: float):
+    if isinstance(end, (int, float)):
+        return start + (end - start) * progress
+    return [a + (b - a) * progress for a, b in zip(start, end)]
+
+
+def _copy(value):
+    return value if isinstance(value, (int, float)) else list(value)
+
+
+class ThemeTransition:
+    def __init__(self):
+        self._transitions = WeakKeyDictionary()
+        self._event = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether any transition is running."""
+
+        return bool(self._transitions)
+
+    def animate(self, widget, *steps: tuple) -> None:
+        """
+        Starts a transition of `widget` from the next frame. Every step is
+        a `(duration, {property: value, ...})` tuple. Running transitions
+        of `widget` that change any of the same properties are replaced.
+        """
+
+        transition = _Transition(steps)
+        transitions = [
+            item
+            for item in self._transitions.get(widget, ())
+            if not item.names & transition.names
+        ]
+        transitions.append(transition)
+        self._transitions[widget] = transitions
+        self.start()
+
+    def start(self) -> None:
+        """Starts driving the registered transitions."""
+
+        if self._event is None and self._transitions:
+            self._event = Clock.schedule_interval(self._update, 0)
+
+    def cancel(self, widget=None, name: str | None = None) -> None:
+        """
+        Stops the transitions of `widget`, or all transitions if `widget` is
+        `None`. If `name` is given, only the changes of the property `name`
+        of `widget` are stopped, the other properties keep transitioning.
+        The stopped properties keep their current values.
+        """
+
+        if widget is None:
+            self._transitions.clear()
+        elif name is None:
+            self._transitions.pop(widget, None)
+        elif widget in self._transitions:
+            transitions = []
+            for transition in self._transitions[widget]:
+                if name in transition.names:
+                    transition.names.discard(name)
+                    transition.steps = [
+                        (
+                            duration,
+                            {key: value for key, value in values.items() if key != name},
+                        )
+                        for duration, values in transition.steps
+                    ]
+                if transition.names:
+                    transitions.append(transition)
+            if transitions:
+                self._transitions[widget] = transitions
+            else:
+                del self._transitions[widget]
+        if not self._transitions:
+            self._stop()
+
+    def finish(self, widget=None) -> None:
+        """
+        Stops the transitions of `widget`, or all transitions if `widget` is
+        `None`, setting the final values of all its steps.
+        """
+
+        if widget is None:
+            items = list(self._transitions.items())
+        else:
+            items = [(widget, self._transitions.get(widget, []))]
+
+        for item_widget, transitions in items:
+            for transition in transitions:
+                for _, values in transition.steps:
+                    for name, value in values.items():
+                        setattr(item_widget, name, value)
+        self.cancel(widget)
+
+    def _stop(self) -> None:
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _update(self, dt: float) -> None:
+        for widget, transitions in list(self._transitions.items()):
+            for transition in transitions[:]:
+                if not self._advance(widget, transition, dt):
+                    transitions.remove(transition)
+            if not transitions:
+                del self._transitions[widget]
+
+        if not self._transitions:
+            self._stop()
+
+    def _advance(self, widget, transition: _Transition, dt: float) -> bool:
+        # Returns whether `transition` has steps left.
+        while transition.steps:
+            duration, values = transition.steps[0]
+            if transition.start_values is None:
+                transition.start_values = {
+                    name: _copy(getattr(widget, name)) for name in values
+                }
+            transition.elapsed += dt
+            if transition.elapsed < duration:
+                progress = transition.elapsed / duration
+                for name, value in values.items():
+                    setattr(
+                        widget,
+                        name,
+                        _interpolate(transition.start_values[name], value, progress),
+                    )
+                return True
+
+            for name, value in values.items():
+                setattr(widget, name, value)
+            # Time left over from this step goes to the next one.
+            dt = transition.elapsed - duration
+            transition.steps.pop(0)
+            transition.start_values = None
+            transition.elapsed = 0
+        return False
+
+
+theme_transition = ThemeTransition()
+"""Driver of the theme style switch transitions of all widgets."""
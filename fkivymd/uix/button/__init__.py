@@ -1,10 +1,23 @@
-from .button import (
-    FButton,
-    FButtonText,
-    FButtonIcon,
-    FButton2,
-    FIconButton, 
-    FSpeedDialButton, 
-    FSpeedDialHintText, 
-    FSpeedDialButtons
+from importlib import import_module
+
+__all__ = (
+    "FButton",
+    "FButtonText",
+    "FButtonIcon",
+    "FButton2",
+    "FIconButton",
+    "FSpeedDialButton",
+    "FSpeedDialHintText",
+    "FSpeedDialButtons",
 )
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".button", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
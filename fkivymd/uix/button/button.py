@@ -119,11 +119,11 @@ __all__ = (
 )
 
 import os
+from weakref import WeakKeyDictionary
 
 from kivy import platform
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang.builder import Builder
 from kivy.metrics import dp
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.properties import (
@@ -141,33 +141,80 @@ from fkivymd.uix.behaviors.extended_background import ExtendedBackgroundBehavior
 from fkivymd.uix.behaviors import FBackgroundColorBehavior
 from fkivymd.uix.behaviors import FCommonElevationBehavior
 from fkivymd.uix.label import FLabel, FIcon
-from FKivyMD import uix_path
+from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 from kivymd import fonts_path
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.floatlayout import FloatLayout
 from kivymd.uix.behaviors import (
     DeclarativeBehavior, 
-    RectangularRippleBehavior, 
-    HoverBehavior
+    RectangularRippleBehavior
 )
 from kivymd.theming import ThemableBehavior
-from kivy.lang import Builder
 from kivy.core.window import Window
 from kivymd.icon_definitions import md_icons
 from fkivymd.uix.behaviors import FStateLayerBehavior
+from fkivymd.uix.behaviors.theme_transition import theme_transition
+
+register_kv(__name__, os.path.join(uix_path, "button", "button.kv"))
+
+# FButton objects waiting for the layout pass.
+_dirty_buttons = set()
+_layout_pass_running = False
+
+
+def _layout_dirty_buttons(*args):
+    # Sizes all the buttons marked since the last pass. The trigger runs
+    # before the next frame is drawn, and again in the same frame if
+    # buttons are marked meanwhile, so the buttons are drawn in their final
+    # size. Changes made by the pass itself don't mark the buttons again.
+    global _layout_pass_running
+
+    buttons = tuple(_dirty_buttons)
+    _dirty_buttons.clear()
+    _layout_pass_running = True
+    try:
+        for button in buttons:
+            button._update_layout()
+    finally:
+        _layout_pass_running = False
+
+
+_trigger_layout_pass = Clock.create_trigger(_layout_dirty_buttons, -1)
+
+
+# Core label of each core label class, measuring the button children.
+_measure_labels = {}
 
-with open(os.path.join(uix_path, "button", "button.kv"), encoding="utf-8") as kvfile:
-    Builder.load_string(kvfile.read())
+
+def _get_content_size(widget):
+    # `texture_size` follows the `text_size` the layout pass sets on the
+    # button children, so they are measured by another core label with
+    # their text and options but no `text_size`. Only the layout of the
+    # text is computed, the child is not rendered again.
+    label = widget._label
+    if not label.text or (
+        (widget.halign == "justify" or widget.strip) and not label.text.strip()
+    ):
+        return [0, 0]
+    measure_label = _measure_labels.get(type(label))
+    if measure_label is None:
+        measure_label = _measure_labels[type(label)] = type(label)()
+    measure_label.options = dict(label.options)
+    measure_label.text_size = None, None
+    measure_label.text = label.text
+    measure_label.resolve_font_name()
+    return list(measure_label.render())
 
 
 class FButtonText(FLabel):
     # kivymd.uix.button.button.MDButton object.
-    _button = ObjectProperty()
+    _button = ObjectProperty(None, allownone=True)
 
 
 class FButtonIcon(FIcon):
-    # FKivyMD.uix.button.button.FButton object.
-    _button = ObjectProperty()
+    # fkivymd.uix.button.button.FButton object.
+    _button = ObjectProperty(None, allownone=True)
 
 class FBaseButton(
     RectangularRippleBehavior, 
@@ -176,6 +223,7 @@ class FBaseButton(
     FBackgroundColorBehavior, 
     FStateLayerBehavior
 ):
+    _state_widget = "FBaseButton"
     elevation_levels = DictProperty(
         {
             0: 0,
@@ -270,21 +318,20 @@ class FButton(DeclarativeBehavior, FBaseButton, ButtonBehavior, BoxLayout):
     theme_width = OptionProperty("Primary", options=("Primary", "Custom"))
     theme_height = OptionProperty("Primary", options=("Primary", "Custom"))
     theme_radius = OptionProperty("Primary", options=['Primary', 'Custom'])
-    # FKivyMD.uix.button.button.FButtonIcon object.
-    _button_icon = ObjectProperty(None)
-    # FKivyMD.uix.button.button.FButtonText object.
-    _button_text = ObjectProperty(None)
-    _last_size = None
+    # fkivymd.uix.button.button.FButtonIcon object.
+    _button_icon = ObjectProperty(None, allownone=True)
+    # fkivymd.uix.button.button.FButtonText object.
+    _button_text = ObjectProperty(None, allownone=True)
     _nChild = 0
-    button_widgets = []
 
     def __init__(self, *args, **kwargs):
+        # FButtonText and FButtonIcon children, in the order they were added.
+        self.button_widgets = []
         super().__init__(*args, **kwargs)
-        Clock.schedule_once(self.set_size, 0.2)
-        Clock.schedule_once(self.set_pos, 0.2)
-        Window.bind(size=Clock.schedule_once(self.set_size))
-        Window.bind(on_maximize=Clock.schedule_once(self.set_size))
-        Window.bind(on_restore=Clock.schedule_once(self.set_size))
+        self.fbind("size", self.set_size)
+        self.fbind("spacing", self.set_size)
+        self.fbind("theme_width", self.set_size)
+        self.fbind("theme_height", self.set_size)
 
     def on_disabled(self, instance_button, is_disabled):
         if is_disabled:
@@ -306,11 +353,10 @@ class FButton(DeclarativeBehavior, FBaseButton, ButtonBehavior, BoxLayout):
             check_hints.append(1)
 
         if any(check_hints):
-            Clock.schedule_once(self.set_size)
+            self.set_size()
 
     def on_orientation(self, *args):
-        Clock.schedule_once(self.set_size)
-        Clock.schedule_once(self.set_pos)
+        self.set_size()
 
     def add_widget(self, widget, *args, **kwargs):
         if isinstance(widget, FButtonText):
@@ -323,94 +369,121 @@ class FButton(DeclarativeBehavior, FBaseButton, ButtonBehavior, BoxLayout):
             self._button_icon = widget
         if isinstance(widget, (FButtonText, FButtonIcon)):
             widget._button = self
-            widget.bind(text=lambda x, y:
-            Clock.schedule_once(lambda z: self.set_size))
+            widget.fbind("text", self.set_size)
+            widget.fbind("texture_size", self.set_size)
             self.button_widgets.append(widget)
             self._nChild += 1
+            self.set_size()
         super().add_widget(widget, *args, **kwargs)
 
-    def set_size(self, *args):
-        def set_size(x):
-            children_widths = []
-            children_heights = []
-
-            for child in self.button_widgets:
-                child_tex_size = getattr(child, "texture_size")
-                children_widths.append(child_tex_size[0])
-                children_heights.append(child_tex_size[1])
-
-            size_func = [sum, max]
-            width_func = sum if self.orientation == "horizontal" else max
-            size_func.remove(width_func)
-            height_func = size_func[0]
-
-            def get_primary_width():
-                width = width_func(children_widths) + self.horizontal_pad * 2
-                if self._nChild > 1:
-                    width += self.spacing if self.orientation == "horizontal" else 0
-                return width
-
-            def get_primary_height():
-                height = height_func(children_heights) + self.vertical_pad * 2
-                if self._nChild > 1:
-                    height += self.spacing if self.orientation == "vertical" else 0
-                return height
-
-            if self.theme_width == "Primary":
-                self.size_hint_x = None
-                if self._nChild == 1 and isinstance(self.button_widgets[-1], FButtonIcon):
-                    self.width = children_widths[0] + self.vertical_pad * 2
-                else:
-                    self.width = get_primary_width()
-            elif self.theme_width == "Custom":
-                self.size_hint_min_x = get_primary_width()
-
-            if self.theme_height == "Primary":
-                self.size_hint_y = None
-                if self._nChild == 1 and isinstance(self.button_widgets[-1], FButtonIcon):
-                    self.height = children_heights[0] + self.vertical_pad * 2
-                else:
-                    self.height = get_primary_height()
-            elif self.theme_height == "Custom":
-                self.size_hint_min_y = get_primary_height()
-            if self._nChild > 1:
-                padding = (((self.width + self.padding[0] + self.padding[2] - sum(children_widths)) / 2)
-                           if self.orientation == "horizontal" else
-                           (self.height + self.padding[1] + self.padding[3] - sum(children_heights)) / 2)
-                for widget, width, height in zip(self.button_widgets, children_widths, children_heights):
-                    if self.orientation == "horizontal":
-                        size_hint_x = (padding + width) / self.width
-                        if isinstance(widget, FButtonIcon):
-                            size_hint_x -= 0.03
-                        widget.size_hint_x = size_hint_x
-                        widget.size_hint_y = 1
-                        widget.text_size = size_hint_x * self.width, None
-                    elif self.orientation == "vertical":
-                        size_hint_y = (padding + height) / self.height
-                        widget.size_hint_y = size_hint_y
-                        widget.size_hint_x = 1
-                        widget.text_size = None, size_hint_y * self.height
-            else:
-                self.button_widgets[-1].size_hint = 1, 1
+    def remove_widget(self, widget, *args, **kwargs):
+        if widget in self.button_widgets:
+            if widget is self._button_text:
+                self._button_text = None
+            elif widget is self._button_icon:
+                self._button_icon = None
+            widget._button = None
+            widget.funbind("text", self.set_size)
+            widget.funbind("texture_size", self.set_size)
+            self.button_widgets.remove(widget)
+            self._nChild -= 1
+            self.set_size()
+        super().remove_widget(widget, *args, **kwargs)
 
-            self._last_size = self.size.copy()
+    def set_size(self, *args):
+        """
+        Marks the button for the layout pass, which sizes all the marked
+        buttons once per frame, before the frame is drawn.
+        """
 
-        if self._nChild and (self.size != self._last_size or args[0] == "<texture>"):
-            Clock.schedule_once(set_size)
+        if not _layout_pass_running:
+            _dirty_buttons.add(self)
+            _trigger_layout_pass()
 
     def set_pos(self, *args):
-        def set_pos(*args):
+        """Marks the button for the layout pass, see :meth:`set_size`."""
+
+        self.set_size()
+
+    def _update_layout(self):
+        if self._nChild:
+            self._update_size()
+            self._update_pos()
+
+    def _update_size(self):
+        children_widths = []
+        children_heights = []
+
+        for child in self.button_widgets:
+            child_tex_size = _get_content_size(child)
+            children_widths.append(child_tex_size[0])
+            children_heights.append(child_tex_size[1])
+
+        size_func = [sum, max]
+        width_func = sum if self.orientation == "horizontal" else max
+        size_func.remove(width_func)
+        height_func = size_func[0]
+
+        def get_primary_width():
+            width = width_func(children_widths) + self.horizontal_pad * 2
             if self._nChild > 1:
+                width += self.spacing if self.orientation == "horizontal" else 0
+            return width
+
+        def get_primary_height():
+            height = height_func(children_heights) + self.vertical_pad * 2
+            if self._nChild > 1:
+                height += self.spacing if self.orientation == "vertical" else 0
+            return height
+
+        if self.theme_width == "Primary":
+            self.size_hint_x = None
+            if self._nChild == 1 and isinstance(self.button_widgets[-1], FButtonIcon):
+                self.width = children_widths[0] + self.vertical_pad * 2
+            else:
+                self.width = get_primary_width()
+        elif self.theme_width == "Custom":
+            self.size_hint_min_x = get_primary_width()
+
+        if self.theme_height == "Primary":
+            self.size_hint_y = None
+            if self._nChild == 1 and isinstance(self.button_widgets[-1], FButtonIcon):
+                self.height = children_heights[0] + self.vertical_pad * 2
+            else:
+                self.height = get_primary_height()
+        elif self.theme_height == "Custom":
+            self.size_hint_min_y = get_primary_height()
+        if self._nChild > 1:
+            padding = (((self.width + self.padding[0] + self.padding[2] - sum(children_widths)) / 2)
+                       if self.orientation == "horizontal" else
+                       (self.height + self.padding[1] + self.padding[3] - sum(children_heights)) / 2)
+            for widget, width, height in zip(self.button_widgets, children_widths, children_heights):
                 if self.orientation == "horizontal":
-                    self.button_widgets[0].halign = "right"
-                    self.button_widgets[1].halign = "left"
+                    size_hint_x = (padding + width) / self.width
+                    if isinstance(widget, FButtonIcon):
+                        size_hint_x -= 0.03
+                    widget.size_hint_x = size_hint_x
+                    widget.size_hint_y = 1
+                    widget.text_size = size_hint_x * self.width, None
                 elif self.orientation == "vertical":
-                    self.button_widgets[1].valign = "top"
-                    self.button_widgets[0].valign = "bottom"
-        if self._nChild:
-            Clock.schedule_once(set_pos)
+                    size_hint_y = (padding + height) / self.height
+                    widget.size_hint_y = size_hint_y
+                    widget.size_hint_x = 1
+                    widget.text_size = None, size_hint_y * self.height
+        else:
+            self.button_widgets[-1].size_hint = 1, 1
+
+    def _update_pos(self):
+        if self._nChild > 1:
+            if self.orientation == "horizontal":
+                self.button_widgets[0].halign = "right"
+                self.button_widgets[1].halign = "left"
+            elif self.orientation == "vertical":
+                self.button_widgets[1].valign = "top"
+                self.button_widgets[0].valign = "bottom"
 
 class FIconButton(RectangularRippleBehavior, ButtonBehavior, FIcon):
+    _state_widget = "FIconButton"
     style = OptionProperty("standard", options=("standard", "filled", "tonal", "outlined"))
     md_bg_color_disabled = ColorProperty(None)
 
@@ -430,11 +503,11 @@ class FSpeedDialButton(
     FCommonElevationBehavior, 
     ButtonBehavior,
     Label, 
-    FStateLayerBehavior,
-    HoverBehavior):
-    # FKivyMD.uix.button.button.FSpeedDialActionHintText object
+    FStateLayerBehavior):
+    _state_widget = "FSpeedDialButton"
+    # fkivymd.uix.button.button.FSpeedDialActionHintText object
     _hint_text = ObjectProperty(None)
-    # FKivyMD.uix.button.button.FSpeedDialButtons object
+    # fkivymd.uix.button.button.FSpeedDialButtons object
     _sub_master = None
     _master = None
     _padding_ = None
@@ -463,12 +536,15 @@ class FSpeedDialButton(
     def on_icon_color(self, instance_label, color: list | str) -> None:
         if self.theme_icon_color == "Custom":
             if self.theme_cls.theme_style_switch_animation:
-                Animation(
-                    color=color,
-                    d=self.theme_cls.theme_style_switch_animation_duration,
-                    t="linear",
-                ).start(self)
+                theme_transition.animate(
+                    self,
+                    (
+                        self.theme_cls.theme_style_switch_animation_duration,
+                        {"color": color},
+                    ),
+                )
             else:
+                theme_transition.cancel(self, "color")
                 self.color = color
 
     def on_enter(self):
@@ -503,16 +579,18 @@ class FSpeedDialButtons(DeclarativeBehavior, ThemableBehavior, FloatLayout):
     closing_time = NumericProperty(0.2)
 
     # class variables
-    _anim_buttons_data = {}
-    _anim_labels_data = {}
     _direction_vals = {'right': 1, 'top': 1,
                        'left': -1, 'bottom': -1}
     _touch_started_inside = None
-    _children = []
-    _child_pos = {}
-    _anim_x_widget = {}
 
     def __init__(self, **kwargs):
+        self._anim_buttons_data = {}
+        self._anim_labels_data = {}
+        # Stack buttons and their offsets from the root button when open.
+        self._children = []
+        self._child_pos = {}
+        # Closing animations of the stack buttons, dropped once finished.
+        self._anim_x_widget = WeakKeyDictionary()
         super().__init__(**kwargs)
         self.size_hint = None, None
         self.size = 0, 0
@@ -647,12 +725,12 @@ class FSpeedDialButtons(DeclarativeBehavior, ThemableBehavior, FloatLayout):
             for anim, widget in self._anim_x_widget.items():
                 anim.stop(widget)
             else:
-                self._anim_x_widget = {}
+                self._anim_x_widget = WeakKeyDictionary()
 
     def do_animation_open_stack(self, anim_data: dict) -> None:
         """
         anim_data = {
-            FKivyMD.uix.button.FSpeedDialButton object :
+            fkivymd.uix.button.FSpeedDialButton object :
             kivy.animation.Animation object
             }
         """
@@ -1,6 +1,19 @@
-from .card import (
-    FFrame,
-    FCard, 
-    FCardSwipe, 
-    FCardSwipeFront
-)
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FFrame",
+    "FCard",
+    "FCardSwipe",
+    "FCardSwipeFront",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".card", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -10,7 +10,6 @@ __all__ = (
 import os
 
 from kivy.animation import Animation
-from kivy.lang.builder import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     NumericProperty,
@@ -21,7 +20,7 @@ from kivy.properties import (
 )
 from kivy import platform
 from fkivymd import uix_path
-from kivy.clock import Clock
+from fkivymd.kv_loader import register_kv
 from kivy.uix.relativelayout import RelativeLayout
 from kivymd.uix.relativelayout import MDRelativeLayout
 from kivy.uix.behaviors import ButtonBehavior
@@ -31,18 +30,18 @@ from kivymd.uix.behaviors import (
     RectangularRippleBehavior
 )
 from fkivymd.uix.behaviors import (
+    FLazyKVBehavior,
     FCommonElevationBehavior, 
     FBackgroundColorBehavior, 
-    FStateLayerBehavior
+    FStateLayerBehavior,
+    FReadyBehavior
 )
 
-with open(
-    os.path.join(uix_path, "card", "card.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read(), filename="FCard.kv")
+register_kv(__name__, os.path.join(uix_path, "card", "card.kv"))
 
 
 class FFrame(
+    FReadyBehavior,
     DeclarativeBehavior, 
     ThemableBehavior, 
     FBackgroundColorBehavior, 
@@ -52,9 +51,8 @@ class FFrame(
     style = OptionProperty("filled", options=("filled", "elevated", "outlined"))
     md_bg_color_disabled = ColorProperty(None)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        Clock.schedule_once(lambda x: self.on_disabled(self, self.disabled))
+    def on_ready(self, *args) -> None:
+        self.on_disabled(self, self.disabled)
 
     def shadow_update(self, *args):
         if self.style == "elevated":
@@ -85,6 +83,7 @@ class FCard(
     ButtonBehavior,
     FFrame
 ):
+    _state_widget = "FCard"
     ripple_effect = BooleanProperty(False)
 
     def on_press(self, *args) -> None:
@@ -138,7 +137,7 @@ class FCard(
                 self.md_bg_color = self._bg_color
 
 
-class FCardSwipe(MDRelativeLayout):
+class FCardSwipe(FLazyKVBehavior, MDRelativeLayout):
     both_sides_slide = False
     anchor = OptionProperty("left", options=("left", "right"))
     opening_transition = StringProperty("out_cubic")
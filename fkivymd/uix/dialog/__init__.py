@@ -1,8 +1,21 @@
-from .dialog import (
-    FDialog, 
-    FDialogHeadlineText, 
-    FDialogIcon, 
-    FDialogSupportingText, 
-    FDialogContentContainer, 
-    FDialogButtonContainer
-)
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FDialog",
+    "FDialogHeadlineText",
+    "FDialogIcon",
+    "FDialogSupportingText",
+    "FDialogContentContainer",
+    "FDialogButtonContainer",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".dialog", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -4,8 +4,8 @@ Dialog creation using kv file:
 
     from kivy.lang import Builder
     from kivymd.app import MDApp
-    import FKivyMD
-    from FKivyMD.uix.dialog import FDialog
+    import fkivymd
+    from fkivymd.uix.dialog import FDialog
     
 
     KV = '''
@@ -80,8 +80,8 @@ Dialog creation using py file:
     from kivy.lang import Builder
 
     from kivymd.app import MDApp
-    from FKivyMD.uix.button import FButton, FButtonText
-    from FKivyMD.uix.dialog import (
+    from fkivymd.uix.button import FButton, FButtonText
+    from fkivymd.uix.dialog import (
         FDialog,
         FDialogIcon,
         FDialogHeadlineText,
@@ -89,8 +89,8 @@ Dialog creation using py file:
         FDialogButtonContainer,
         FDialogContentContainer,
     )
-    from FKivyMD.uix.divider import FDivider
-    from FKivyMD.uix.list import (
+    from fkivymd.uix.divider import FDivider
+    from fkivymd.uix.list import (
         FListItem,
         FListItemLeadingIcon,
         FListItemSupportingText,
@@ -196,7 +196,6 @@ from kivy.properties import (
     VariableListProperty
 )
 from kivy.metrics import dp
-from kivy.lang.builder import Builder
 from kivy.animation import Animation
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.relativelayout import  RelativeLayout
@@ -204,14 +203,13 @@ from kivymd.uix.behaviors import (
     DeclarativeBehavior, 
     ScaleBehavior
 )
+from fkivymd.uix.behaviors import FLazyKVBehavior
 from fkivymd.uix.card import FFrame
 from fkivymd.uix.label import FLabel, FIcon
 from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 
-with open(
-    os.path.join(uix_path, "dialog", "dialog.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "dialog", "dialog.kv"))
 
 
 class FDialogHeadlineText(FLabel):
@@ -223,16 +221,16 @@ class FDialogIcon(FIcon):
 class FDialogSupportingText(FLabel):
     pass
 
-class FDialogContentContainer(DeclarativeBehavior, BoxLayout):
+class FDialogContentContainer(FLazyKVBehavior, DeclarativeBehavior, BoxLayout):
     pass
 
-class FDialogContentContainer(DeclarativeBehavior, BoxLayout):
+class FDialogContentContainer(FLazyKVBehavior, DeclarativeBehavior, BoxLayout):
     pass
 
-class FDialogButtonContainer(DeclarativeBehavior, BoxLayout):
+class FDialogButtonContainer(FLazyKVBehavior, DeclarativeBehavior, BoxLayout):
     pass
 
-class FDialogScrim(RelativeLayout):
+class FDialogScrim(FLazyKVBehavior, RelativeLayout):
     color = ColorProperty([0,0,0,0])
 
 
@@ -260,7 +258,7 @@ class FDialog(ScaleBehavior, FFrame):
     _anim_duration = NumericProperty(0.3)
     _is_open = BooleanProperty(False)
     _touch_started_inside = None
-    # FKivyMD.uix.dialog.dialog.FDialogScrim object
+    # fkivymd.uix.dialog.dialog.FDialogScrim object
     _scrim = ObjectProperty()
     _widgets_sorted = BooleanProperty(False)
     _widget_classes = [FDialogIcon, FDialogHeadlineText, FDialogSupportingText, 
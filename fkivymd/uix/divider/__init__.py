@@ -1 +1,16 @@
-from .divider import FDivider
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FDivider",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".divider", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
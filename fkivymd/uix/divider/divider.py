@@ -2,29 +2,27 @@ __all__ = ("FDivider",)
 
 import os
 
-from kivy.clock import Clock
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import ColorProperty, NumericProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.theming import ThemableBehavior
 from fkivymd import uix_path
+from fkivymd.uix.behaviors import FLazyKVBehavior, FReadyBehavior
+from fkivymd.kv_loader import register_kv
 
-with open(
-    os.path.join(uix_path, "divider", "divider.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "divider", "divider.kv"))
 
 
-class FDivider(DeclarativeBehavior, ThemableBehavior, BoxLayout):
+class FDivider(
+    FLazyKVBehavior, FReadyBehavior, DeclarativeBehavior, ThemableBehavior, BoxLayout
+):
     color = ColorProperty(None)
     divider_length = NumericProperty()
     divider_thickness = NumericProperty(dp(1))
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        Clock.schedule_once(self.on_orientation)
+    def on_ready(self, *args) -> None:
+        self.on_orientation()
 
     def on_orientation(self, *args) -> None:
         if self.orientation == "vertical":
@@ -1 +1,18 @@
-from .label import FLabel, FIcon, FBadge
+from importlib import import_module
+
+__all__ = (
+    "FLabel",
+    "FIcon",
+    "FBadge",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".label", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -35,6 +35,17 @@ Example::
 2. Label selection feature removed:
 Thought it was unnecessary, so removed it.
 
+3. Shared textures:
+Set :attr:`texture_cache` to `True` to draw the texture from a
+process-wide cache instead of rendering it for every label.
+Labels with the same text and font options share one texture.
+
+Example::
+
+    FLabel:
+        text: 'Cancel'
+        texture_cache: True
+
 For More Information on how to use Label 
 and change attributes of Label, see::
 
@@ -51,10 +62,10 @@ __all__ = (
 )
 
 import os
+import weakref
 
 from kivy.animation import Animation
 from kivy.core.clipboard import Clipboard
-from kivy.lang.builder import Builder
 
 from kivy.properties import (
     StringProperty, 
@@ -64,8 +75,10 @@ from kivy.properties import (
     ObjectProperty, 
 )
 from kivy.uix.label import Label
+from kivy.utils import get_hex_from_color
 
 from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 from kivymd.theming import ThemableBehavior
 from kivymd.uix import MDAdaptiveWidget
 from kivymd.uix.behaviors import (
@@ -73,9 +86,24 @@ from kivymd.uix.behaviors import (
     TouchBehavior,
 )
 from fkivymd.uix.behaviors import FBackgroundColorBehavior, FStateLayerBehavior
+from fkivymd.uix.label.texture_cache import texture_cache
+
+register_kv(__name__, os.path.join(uix_path, "label", "label.kv"))
+
+
+def _freeze(value):
+    # Hashable form of a label property value.
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(x) for x in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
 
-with open(os.path.join(uix_path, "label", "label.kv"), encoding="utf-8") as kvfile:
-    Builder.load_string(kvfile.read())
+
+def _release_texture_key(holder):
+    if holder[0] is not None:
+        texture_cache.release(holder[0])
+        holder[0] = None
 
 
 class FLabelBase(
@@ -93,11 +121,11 @@ class FLabelBase(
     For more information, see in the
     :class:`~kivymd.uix.behaviors.declarative_behavior.DeclarativeBehavior` and
     :class:`~kivymd.theming.ThemableBehavior` and
-    :class:`~FKivyMD.uix.behaviors.backgroundcolor_behavior.BackgroundColorBehavior` and
+    :class:`~fkivymd.uix.behaviors.backgroundcolor_behavior.BackgroundColorBehavior` and
     :class:`~kivymd.uix.MDAdaptiveWidget` and
     :class:`~kivy.uix.label.Label` and
     :class:`~kivymd.uix.behaviors.touch_behavior.TouchBehavior` and 
-    :class: `~FKivyMD.uix.behaviors.state_layer_behavior.FStateLayerBehavior
+    :class: `~fkivymd.uix.behaviors.state_layer_behavior.FStateLayerBehavior
     classes documentation.
 
     :Events:
@@ -113,10 +141,139 @@ class FLabelBase(
     Allows you to copy text to the clipboard by double-clicking on the label.
     """
 
+    texture_cache = BooleanProperty(False)
+    """
+    Draws the texture from the process-wide texture cache instead of
+    rendering a texture of its own. Labels showing the same text with the
+    same font options share one texture, which saves rasterizing and
+    texture memory for short strings repeated many times.
+
+    Labels without markup share the texture whatever their color. Enabled
+    by default for :class:`FIcon`.
+    """
+
+    # Color the white textures of the cache are drawn with.
+    _texture_tint = ColorProperty([1, 1, 1, 1])
+    # Cache key of the texture in use, in a list shared with the finalizer
+    # that releases it.
+    _texture_cache_key = None
+
+    # Label properties left out of the texture cache key: the text is part
+    # of it as rendered, the colors are applied when the texture is drawn.
+    _texture_key_excluded = (
+        "text",
+        "color",
+        "disabled_color",
+        "outline_color",
+        "disabled_outline_color",
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.register_event_type("on_copy")
 
+    def texture_update(self, *largs):
+        key = self._get_texture_cache_key() if self.texture_cache else None
+        if key is None:
+            self._release_texture()
+            # The cached textures are rendered without the label color.
+            options = self._label.options
+            options["color"] = self.disabled_color if self.disabled else self.color
+            super().texture_update(*largs)
+        else:
+            entry = texture_cache.acquire(key)
+            if entry is None:
+                entry = texture_cache.add(key, self._render_cached_texture(key))
+            self._release_texture()
+            self._texture_cache_key[0] = key
+            self.texture = None
+            self.texture = entry.texture
+            self.texture_size = list(entry.texture.size)
+            self.is_shortened = entry.is_shortened
+            if self.markup:
+                self.refs = entry.refs
+                self.anchors = entry.anchors
+        self._update_texture_tint()
+
+    def _trigger_texture_update(self, name=None, source=None, value=None):
+        if (
+            source
+            and name in ("color", "disabled_color", "disabled")
+            and not self.markup
+            and self._texture_cache_key
+            and self._texture_cache_key[0] is not None
+        ):
+            # The cached texture is tinted when drawn, no need to render it.
+            self._update_texture_tint()
+            return
+        super()._trigger_texture_update(name, source, value)
+
+    def _get_texture_cache_key(self) -> tuple | None:
+        label = self._label
+        text = label.text
+        if (
+            not text
+            or self.outline_width
+            or (self.halign == "justify" or self.strip) and not text.strip()
+        ):
+            return None
+
+        if self.markup:
+            # As `Label` renders markup: the color is part of the text, so
+            # of the key, and the texture is drawn untinted.
+            text = self.text
+            if self.halign == "justify" or self.strip:
+                text = text.strip()
+            text = "".join(
+                (
+                    "[color=",
+                    get_hex_from_color(
+                        self.disabled_color if self.disabled else self.color
+                    ),
+                    "]",
+                    text,
+                    "[/color]",
+                )
+            )
+
+        return (text,) + tuple(
+            _freeze(getattr(self, name))
+            for name in self._font_properties
+            if name not in self._texture_key_excluded
+        )
+
+    def _render_cached_texture(self, key):
+        options = {name: getattr(self, name) for name in self._font_properties}
+        options["usersize"] = self.text_size
+        options["color"] = (1, 1, 1, 1)
+        core_label = self._label.__class__(**options)
+        core_label.text = key[0]
+        core_label.refresh()
+        if self.markup and core_label.texture:
+            # Force the rendering to get the references.
+            core_label.texture.bind()
+        return core_label
+
+    def _release_texture(self):
+        if self._texture_cache_key is None:
+            self._texture_cache_key = [None]
+            weakref.finalize(self, _release_texture_key, self._texture_cache_key)
+        else:
+            _release_texture_key(self._texture_cache_key)
+
+    def on_texture_cache(self, instance, value) -> None:
+        self._trigger_texture()
+
+    def _update_texture_tint(self):
+        if (
+            not self.markup
+            and self._texture_cache_key
+            and self._texture_cache_key[0] is not None
+        ):
+            self._texture_tint = self.disabled_color if self.disabled else self.color
+        else:
+            self._texture_tint = (1, 1, 1, 1)
+
     def on_double_tap(self, touch, *args) -> None:
         """Fired by double-clicking on the widget"""
 
@@ -129,6 +286,7 @@ class FLabelBase(
 
 
 class FLabel(FLabelBase):
+    _state_widget = "FLabel"
     text_color = ColorProperty(None)
     text_color_disabled = ColorProperty(None)
 
@@ -143,6 +301,8 @@ class FLabel(FLabelBase):
 
 
 class FIcon(FLabelBase):
+    _state_widget = "FIcon"
+    texture_cache = BooleanProperty(True)
     font_style = StringProperty("Icon")
     role = StringProperty("large")
     icon = StringProperty("blank")
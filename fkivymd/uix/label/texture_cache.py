@@ -0,0 +1,98 @@
+"""
+Label/Texture Cache
+===================
+
+Process-wide cache of rendered label textures. Labels rendering the same
+text with the same font options share one texture instead of rasterizing
+and uploading their own copy.
+
+The textures of labels without markup are rendered white and tinted with
+the label color when they are drawn, so labels of any color share them.
+Every texture is reference counted by the labels that show it; textures no
+longer shown are kept for reuse and evicted least recently used first.
+
+.. note:: The following classes are intended for in-house use of the library.
+"""
+
+from __future__ import annotations
+
+__all__ = ("TextureCache", "texture_cache")
+
+from collections import OrderedDict
+
+
+class _TextureCacheEntry:
+    __slots__ = (
+        "core_label",
+        "texture",
+        "is_shortened",
+        "refs",
+        "anchors",
+        "refcount",
+    )
+
+    def __init__(self, core_label):
+        # Core label used only for this texture: it fills the texture when
+        # it is first drawn and again after the loss of the GL context.
+        self.core_label = core_label
+        self.texture = core_label.texture
+        self.is_shortened = core_label.is_shortened
+        # Markup references and anchors, see `kivy.uix.label.Label.refs`.
+        self.refs = getattr(core_label, "refs", {})
+        self.anchors = getattr(core_label, "anchors", {})
+        self.refcount = 1
+
+
+class TextureCache:
+    max_unused = 256
+    """Number of textures kept while no label shows them."""
+
+    def __init__(self):
+        self._entries = {}
+        # Entries without references, least recently used first.
+        self._unused = OrderedDict()
+
+    def acquire(self, key) -> _TextureCacheEntry | None:
+        """
+        Returns the entry of `key` with a new reference,
+        `None` if there is no texture for `key`.
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not entry.refcount:
+                del self._unused[key]
+            entry.refcount += 1
+        return entry
+
+    def add(self, key, core_label) -> _TextureCacheEntry:
+        """
+        Adds the texture rendered by `core_label` for `key` and returns its
+        entry with a reference.
+        """
+
+        entry = self._entries[key] = _TextureCacheEntry(core_label)
+        return entry
+
+    def release(self, key) -> None:
+        """Releases a reference to the texture of `key`."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.refcount -= 1
+        if not entry.refcount:
+            self._unused[key] = entry
+            while len(self._unused) > self.max_unused:
+                old_key, _ = self._unused.popitem(last=False)
+                del self._entries[old_key]
+
+    def clear(self) -> None:
+        """Removes the textures no label shows."""
+
+        for key in self._unused:
+            del self._entries[key]
+        self._unused.clear()
+
+
+texture_cache = TextureCache()
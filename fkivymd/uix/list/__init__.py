@@ -1,14 +1,29 @@
-from .list import (
-    FList, 
-    FListItem, 
-    FListItemLeadingAvatar,
-    FListItemLeadingText, 
-    FListItemLeadingIcon, 
-    FListItemLeadingThumbnail, 
-    FListItemHeadlineText, 
-    FListItemSupportingText, 
-    FListItemTertiaryText, 
-    FListItemTrailingText, 
-    FListItemTrailingCheckBox, 
-    FListItemTrailingIcon
-)
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FList",
+    "FListItem",
+    "FListItemLeadingAvatar",
+    "FListItemLeadingText",
+    "FListItemLeadingIcon",
+    "FListItemLeadingThumbnail",
+    "FListItemHeadlineText",
+    "FListItemSupportingText",
+    "FListItemTertiaryText",
+    "FListItemTrailingText",
+    "FListItemTrailingCheckBox",
+    "FListItemTrailingIcon",
+    "FRecycleList",
+    "FRecycleListItem",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".list", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -12,13 +12,18 @@ __all__ = (
     "FListItemTertiaryText", 
     "FListItemTrailingText", 
     "FListItemTrailingCheckBox", 
-    "FListItemTrailingIcon"
+    "FListItemTrailingIcon",
+    "FRecycleList",
+    "FRecycleListItem",
 )
 
 import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
 
-from kivy.lang.builder import Builder
 from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 from kivy.properties import (
     NumericProperty, 
     ColorProperty,
@@ -26,14 +31,18 @@ from kivy.properties import (
     ObjectProperty
 )
 from kivy import platform
+from kivy.clock import Clock
+from kivy.metrics import dp
 from kivymd.uix.behaviors import (
     DeclarativeBehavior, 
     CircularRippleBehavior
 )
-from fkivymd.uix.behaviors import FBackgroundColorBehavior
+from fkivymd.uix.behaviors import (
+    FBackgroundColorBehavior,
+    FHoverBehavior,
+    FLazyKVBehavior,
+)
 from kivymd.uix import MDAdaptiveWidget
-from kivy.clock import Clock
-from kivymd.uix.behaviors.focus_behavior import FocusBehavior
 from kivy.uix.behaviors import ButtonBehavior
 from kivymd.theming import ThemableBehavior
 from kivy.uix.boxlayout import BoxLayout
@@ -43,15 +52,19 @@ from fkivymd.uix.button import FIconButton
 from kivy.uix.image import Image
 from kivymd.uix.fitimage import FitImage
 from kivy.uix.gridlayout import GridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataAdapter, RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 
 
-with open(
-    os.path.join(uix_path, "list", "list.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "list", "list.kv"))
 
 
-class StateLayerBehavior(FocusBehavior):
+class StateLayerBehavior(FHoverBehavior):
+    # Focus properties of `kivymd.uix.behaviors.StateFocusBehavior`.
+    focus_behavior = BooleanProperty(True)
+    focus_color = ColorProperty(None)
+    unfocus_color = ColorProperty(None)
     state_layer_color = ColorProperty([0, 0, 0, 0])
     state_hover = NumericProperty(0.04)
     state_press = NumericProperty(0.12)
@@ -173,6 +186,30 @@ def has_unique_widgets(widgets):
 class FListException(BaseException):
     pass
 
+
+def _longest_increasing_run(values: list) -> set:
+    # Indices of a longest increasing subsequence of `values`.
+    # Index and value of the smallest tail of the runs of each length.
+    tails = []
+    tail_values = []
+    previous = [None] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length:
+            previous[index] = tails[length - 1]
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+    run = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        run.add(index)
+        index = previous[index]
+    return run
+
 class FList(
     DeclarativeBehavior, 
     ThemableBehavior, 
@@ -182,10 +219,259 @@ class FList(
 ):
     _list_vertical_padding = NumericProperty("8dp")
 
+    # Number of open `batch` contexts.
+    _batch_depth = 0
+    # Whether a layout was asked for during the batch.
+    _layout_deferred = False
+    # Key -> item of the items made by `update_from_data`.
+    _keyed_items = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.adaptive_height = True
 
+    @contextmanager
+    def batch(self):
+        """
+        Context in which the list is not laid out, however many items are
+        added, removed or resized. The list is laid out once when the
+        outermost context exits::
+
+            with flist.batch():
+                flist.clear_widgets()
+                for row in rows:
+                    flist.add_widget(FListItem(FListItemHeadlineText(text=row)))
+
+        Useful when the changes span several frames, as the items are
+        otherwise laid out again at the end of every frame.
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._layout_deferred:
+                self._layout_deferred = False
+                self._trigger_layout()
+
+    def add_widgets(self, widgets) -> None:
+        """Adds `widgets` in a :meth:`batch`, with one layout at the end."""
+
+        with self.batch():
+            for widget in widgets:
+                self.add_widget(widget)
+
+    def do_layout(self, *args) -> None:
+        if self._batch_depth:
+            self._layout_deferred = True
+            return
+        super().do_layout(*args)
+
+    def update_from_data(self, data: list, key: str = "key") -> None:
+        """
+        Makes the list show one :class:`FListItem` for every dict of `data`,
+        in order. Each dict has a unique `key` value, the rest of it is
+        passed to :meth:`FListItem.update_from_data`::
+
+            flist.update_from_data(
+                [
+                    {"key": job.id, "headline_text": job.name, "divider": True}
+                    for job in queue
+                ]
+            )
+
+        The items of the previous call are reused by key: only the items of
+        new keys are made, the items of missing keys removed, the other
+        items updated in place and the fewest items moved to get the new
+        order. The list is laid out once. Widgets not made by this method
+        are removed from the list.
+        """
+
+        previous = self._keyed_items or {}
+        keyed_items = {}
+        for item_data in data:
+            item_key = item_data.get(key)
+            if item_key is None or item_key in keyed_items:
+                raise FListException(
+                    f"Every item needs a unique {key!r} value, got {item_key!r}"
+                )
+            item = previous.get(item_key)
+            if item is None:
+                item = FListItem()
+            # Properties set to their current value dispatch nothing, the
+            # labels only render the texts that changed.
+            item.update_from_data(
+                {name: value for name, value in item_data.items() if name != key}
+            )
+            keyed_items[item_key] = item
+        self._keyed_items = keyed_items
+
+        with self.batch():
+            new_order = list(keyed_items.values())
+            kept = set(new_order)
+            for widget in self.children[:]:
+                if widget not in kept:
+                    self.remove_widget(widget)
+
+            # The items in the longest run already in the new order stay,
+            # the others are moved.
+            positions = {
+                widget: position
+                for position, widget in enumerate(reversed(self.children))
+            }
+            existing = [item for item in new_order if item in positions]
+            stable = {
+                existing[i]
+                for i in _longest_increasing_run(
+                    [positions[item] for item in existing]
+                )
+            }
+            for item in existing:
+                if item not in stable:
+                    self.remove_widget(item)
+            for position, item in enumerate(new_order):
+                if item not in stable:
+                    self.add_widget(item, index=len(self.children) - position)
+
+    def extend_async(self, items, budget_ms: float = 8, on_progress=None):
+        """
+        Adds `items` to the list without blocking the main loop: the items
+        are made in slices of at most `budget_ms` of work per frame. The
+        items are :class:`FListItem` widgets or dicts of plain data, made
+        into items with :meth:`FListItem.update_from_data`; a generator is
+        consumed lazily, so the items are only made when their slice runs::
+
+            extension = flist.extend_async(
+                (
+                    {"headline_text": f"Contact {i}", "leading_icon": "account"}
+                    for i in range(5000)
+                ),
+                on_progress=lambda done, total: print(done, total),
+            )
+
+        The number of items of a slice comes from the measured time of the
+        frames per item made, so the work an item causes later in the frame
+        (layout, kv bindings) counts too. Adding items moves all the items
+        of the list, so the first slice is added right away and the
+        following ones once there are as many of them as items already
+        added, with one layout per batch. No items are made in the frames
+        laying out a batch.
+
+        `on_progress(done, total)` is called after every slice with the
+        number of items made so far, `total` is `None` when `items` has no
+        length. Returns the running extension: ``extension.is_triggered``
+        is `True` until all the items are added, ``extension.cancel()``
+        adds the items already made and stops.
+        """
+
+        total = len(items) if hasattr(items, "__len__") else None
+        return _ListExtension(self, iter(items), total, budget_ms / 1000, on_progress)
+
+
+# Frames after an adding of `FList.extend_async` that can still be busy
+# with its layout.
+_SETTLE_FRAMES = 3
+
+
+class _ListExtension:
+    # Running `FList.extend_async`.
+
+    def __init__(self, flist, items, total, budget, on_progress):
+        self._list = flist
+        self._items = items
+        self._total = total
+        self._budget = budget
+        self._on_progress = on_progress
+        self._pending = []
+        self._added = self._done = 0
+        # Measured time of a frame per item made.
+        self._item_time = None
+        # CPU time at the start of the last slice, and what it did.
+        self._slice_start = None
+        self._slice_made = 0
+        self._slice_added = False
+        # Frames waited after the last adding, `None` when not waiting.
+        self._settle_frames = None
+        # Not a bound method, which the clock only references weakly: the
+        # items are added even if the caller drops the extension.
+        self._event = Clock.schedule_interval(lambda *args: self._run_slice(), 0)
+        self._run_slice()
+
+    @property
+    def is_triggered(self) -> bool:
+        """`True` until all the items are added or it is cancelled."""
+
+        return bool(self._event.is_triggered)
+
+    def cancel(self) -> None:
+        """Stops making items, the items already made are added."""
+
+        self._event.cancel()
+        self._add_pending()
+
+    def _run_slice(self) -> bool:
+        # The CPU time of the whole frame, the sleeps between frames left out.
+        now = time.thread_time()
+        if self._slice_start is not None:
+            frame_time = now - self._slice_start
+            if self._slice_added:
+                self._settle_frames = 0
+            elif self._settle_frames is not None:
+                self._settle_frames += 1
+                if frame_time <= self._budget or self._settle_frames >= _SETTLE_FRAMES:
+                    self._settle_frames = None
+            elif self._slice_made:
+                item_time = frame_time / self._slice_made
+                self._item_time = (
+                    item_time
+                    if self._item_time is None
+                    else (self._item_time + item_time) / 2
+                )
+        self._slice_start = now
+        self._slice_made = 0
+        self._slice_added = False
+
+        if self._settle_frames is not None:
+            # The moved items are still laid out (the kv bindings run at the
+            # end of a frame), making items now would overrun the frame.
+            return True
+
+        limit = (
+            max(1, int(self._budget / self._item_time))
+            if self._item_time
+            else None
+        )
+        end = time.perf_counter() + self._budget
+        finished = True
+        for item in self._items:
+            if isinstance(item, dict):
+                data = item
+                item = FListItem()
+                item.update_from_data(data)
+            self._pending.append(item)
+            self._slice_made += 1
+            if self._slice_made == limit or time.perf_counter() >= end:
+                finished = False
+                break
+        self._done += self._slice_made
+
+        if finished or len(self._pending) >= self._added:
+            self._add_pending()
+        if self._on_progress:
+            self._on_progress(self._done, self._total)
+        if finished:
+            self._event.cancel()
+        return not finished
+
+    def _add_pending(self) -> None:
+        if self._pending:
+            self._list.add_widgets(self._pending)
+            self._added += len(self._pending)
+            self._pending = []
+            self._slice_added = True
+
+
 class FListItem(
     DeclarativeBehavior,
     FBackgroundColorBehavior,
@@ -198,6 +484,57 @@ class FListItem(
     divider_color = ColorProperty([0,0,0,0])
     md_bg_color_disabled = ColorProperty([0,0,0,0])
 
+    # Data key -> child widget created by `update_from_data`.
+    _data_widgets = None
+
+    def update_from_data(self, data: dict) -> None:
+        """
+        Updates the item from a dict of plain data. The keys listed in
+        `data_widgets` (``headline_text``, ``supporting_text``,
+        ``tertiary_text``, ``leading_icon``, ``leading_avatar``,
+        ``leading_text``, ``trailing_text``, ``trailing_icon``,
+        ``trailing_checkbox``) create, update or remove the child widgets of
+        the item, any other key is set as a property of the item::
+
+            item.update_from_data(
+                {
+                    "headline_text": "Headline",
+                    "supporting_text": "Supporting text",
+                    "leading_icon": "account",
+                    "trailing_checkbox": True,
+                    "divider": True,
+                }
+            )
+
+        The child widgets are kept and reused by the following updates.
+        """
+
+        if self._data_widgets is None:
+            self._data_widgets = {}
+        widgets = self._data_widgets
+
+        # Remove first, the leading and trailing containers only take a
+        # single widget.
+        for key, widget in widgets.items():
+            if data.get(key) is None and widget.parent:
+                widget.parent.remove_widget(widget)
+
+        for key, (widget_class, name) in data_widgets.items():
+            value = data.get(key)
+            if value is None:
+                continue
+            widget = widgets.get(key)
+            if widget is None:
+                widget = widgets[key] = widget_class(**{name: value})
+            else:
+                setattr(widget, name, value)
+            if not widget.parent:
+                self.add_widget(widget)
+
+        for key, value in data.items():
+            if key not in data_widgets:
+                setattr(self, key, value)
+
     def add_widget(self, widget, *args, **kwargs):
         if isinstance(widget, 
                       (FListItemHeadlineText, 
@@ -212,27 +549,16 @@ class FListItem(
             if isinstance(widget, (FListItemLeadingAvatar, 
                                    FListItemLeadingThumbnail)):
                 widget._list_item = self
+            # The container takes the width of the widget from its
+            # `minimum_width`, in the layout pass before the next frame.
             self.ids.leading_container.add_widget(widget)
-            Clock.schedule_once(
-                    lambda x: self._set_with_container(
-                        self.ids.leading_container, widget
-                    )
-                )
         elif isinstance(widget, 
                         (FListItemTrailingText, 
                          FListItemTrailingCheckBox, 
                          FListItemTrailingIcon)):
             self.ids.trailing_container.add_widget(widget)
-            Clock.schedule_once(
-                    lambda x: self._set_with_container(
-                        self.ids.trailing_container, widget
-                    )
-                )
         elif widget.__class__.__name__.endswith('Container'):
             super().add_widget(widget, *args, **kwargs)
-            
-    def _set_with_container(self, container, widget):
-        container.width = widget.width
 
 
 class FListLeadingContainer(BoxLayout):
@@ -312,7 +638,7 @@ class FListItemTrailingCheckBox(FCheckBox):
     pass
 
 class FListItemLeadingThumbnail(Image):
-    # FKivyMD.uix.list.FListItem object
+    # fkivymd.uix.list.FListItem object
     _list_item = ObjectProperty()
 
     def on_kv_post(self, base_widget):
@@ -324,10 +650,118 @@ class FListItemLeadingThumbnail(Image):
         return super().on_kv_post(base_widget)
     
 class FListItemLeadingAvatar(
+    FLazyKVBehavior,
     ThemableBehavior, 
     CircularRippleBehavior, 
     ButtonBehavior, 
     FitImage
 ):
-    # FKivyMD.uix.list.FList object
-    _list_item = ObjectProperty()
\ No newline at end of file
+    # fkivymd.uix.list.FList object
+    _list_item = ObjectProperty()
+
+
+data_widgets = {
+    "headline_text": (FListItemHeadlineText, "text"),
+    "supporting_text": (FListItemSupportingText, "text"),
+    "tertiary_text": (FListItemTertiaryText, "text"),
+    "leading_icon": (FListItemLeadingIcon, "icon"),
+    "leading_avatar": (FListItemLeadingAvatar, "source"),
+    "leading_text": (FListItemLeadingText, "text"),
+    "trailing_text": (FListItemTrailingText, "text"),
+    "trailing_icon": (FListItemTrailingIcon, "icon"),
+    "trailing_checkbox": (FListItemTrailingCheckBox, "active"),
+}
+"""
+Data keys of :meth:`FListItem.update_from_data` and :class:`FRecycleList`
+with the child widget class and the widget property that takes the value.
+"""
+
+# Height of an item by the number of its text lines, as in `<FListItem>`.
+_item_heights = {0: dp(100), 1: dp(56), 2: dp(72), 3: dp(88)}
+
+
+def get_item_height(data: dict) -> float:
+    """Returns the height of a list item made from the `data` dict."""
+
+    return _item_heights[
+        sum(
+            data.get(key) is not None
+            for key in ("headline_text", "supporting_text", "tertiary_text")
+        )
+    ]
+
+
+class FRecycleListItem(RecycleDataViewBehavior, FListItem):
+    """
+    View class of :class:`FRecycleList`: a :class:`FListItem` that is
+    rebound to the data of the row it shows.
+    """
+
+    _recycle_list = None
+    _index = None
+    _checkbox = None
+
+    def refresh_view_attrs(self, rv, index, data):
+        self._recycle_list = rv
+        self._index = index
+        sizing_attrs = RecycleDataAdapter._sizing_attrs
+        self.update_from_data(
+            {key: value for key, value in data.items() if key not in sizing_attrs}
+        )
+
+        checkbox = self._data_widgets.get("trailing_checkbox")
+        if checkbox is not self._checkbox:
+            self._checkbox = checkbox
+            checkbox.fbind("active", self._on_checkbox_active)
+
+    def _on_checkbox_active(self, instance, value):
+        # Write the state back, so the row keeps it when it is recycled.
+        data = self._recycle_list.data[self._index]
+        if "trailing_checkbox" in data:
+            data["trailing_checkbox"] = value
+
+
+class FRecycleListLayout(RecycleBoxLayout):
+    def compute_sizes_from_data(self, data, flags):
+        super().compute_sizes_from_data(data, flags)
+        # Rows without a height get the height of their text lines.
+        for item, opts in zip(data, self.view_opts):
+            if opts["height_none"]:
+                opts["size"][1] = get_item_height(item)
+                opts["height_none"] = False
+
+
+class FRecycleList(
+    DeclarativeBehavior,
+    ThemableBehavior,
+    FBackgroundColorBehavior,
+    RecycleView
+):
+    """
+    Virtualized list. Takes the rows as a list of plain dicts (see
+    :attr:`data_widgets` for the keys) and only creates the
+    :class:`FRecycleListItem` views needed to cover the viewport::
+
+        FRecycleList(
+            data=[
+                {
+                    "headline_text": f"Contact {i}",
+                    "supporting_text": "+1 555 0100",
+                    "leading_icon": "account",
+                    "trailing_checkbox": False,
+                }
+                for i in range(20000)
+            ]
+        )
+
+    The state of the trailing checkbox is written back to ``data``.
+    """
+
+    _list_vertical_padding = NumericProperty("8dp")
+
+    def __init__(self, *args, **kwargs):
+        # `RecycleView` ignores `data` passed before its data model exists.
+        data = kwargs.pop("data", None)
+        super().__init__(*args, **kwargs)
+        if data is not None:
+            self.data = data
@@ -1 +1,16 @@
-from .selectioncontrol import FCheckBox
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FCheckBox",
+)
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        return getattr(import_module(".selectioncontrol", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -7,14 +7,10 @@ from fkivymd.uix.label import FIcon
 from kivy.properties import AliasProperty, ColorProperty, StringProperty
 
 import os
-from FKivyMD import uix_path
-from kivy.lang.builder import Builder
+from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 
-with open(
-    os.path.join(uix_path, "selectioncontrol", "selectioncontrol.kv"),
-    encoding="utf-8",
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "selectioncontrol", "selectioncontrol.kv"))
 
 
 class FCheckBox(
@@ -1,5 +1,27 @@
-from .textfield import (
-    FTextField,
-    FTextFieldLeadingButton,
-    FTextFieldTrailingButton
-)
\ No newline at end of file
+from importlib import import_module
+
+__all__ = (
+    "FTextField",
+    "FTextFieldLeadingButton",
+    "FTextFieldTrailingButton",
+    "FSuggestionProvider",
+    "FPrefixIndex",
+)
+
+# Module of the classes not defined in `textfield`.
+_modules = {
+    "FSuggestionProvider": ".suggestion",
+    "FPrefixIndex": ".suggestion",
+}
+
+
+def __getattr__(name):
+    # Import the component module only when one of its classes is used.
+    if name in __all__:
+        module = _modules.get(name, ".textfield")
+        return getattr(import_module(module, __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,194 @@
+"""
+Text Field/Suggestion
+=====================
+
+Suggestions of :class:`~fkivymd.uix.textfield.FTextField` while the user
+types, see :attr:`~fkivymd.uix.textfield.FTextField.suggestion_provider`.
+
+A provider is searched in the thread pool of the text fields, so a large
+index never blocks a frame. :class:`FPrefixIndex` is the in-memory provider:
+the items are sorted once, in a thread of their own, and a search is a
+binary search for the first item starting with the text::
+
+    products = FPrefixIndex(product_names)
+
+    FTextField(
+        hint_text="Product",
+        suggestion_provider=products,
+        on_suggestion=lambda text_field, item: print(item),
+    )
+
+The results are shown in a :class:`~fkivymd.uix.list.FRecycleList` under the
+text field: only the visible rows have views, and a new search only rebinds
+them to the new results.
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "FSuggestionProvider",
+    "FPrefixIndex",
+    "get_suggestion_text",
+)
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+
+from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
+from fkivymd.uix.list.list import FRecycleList, FRecycleListItem, get_item_height
+from kivy.core.window import Window
+from kivy.properties import ObjectProperty
+from kivy.uix.behaviors import FocusBehavior
+
+register_kv(__name__, os.path.join(uix_path, "textfield", "suggestion.kv"))
+
+# After the last code point: every text starting with a prefix sorts
+# before the prefix followed by it.
+_MAX_CHAR = "\U0010ffff"
+
+
+def get_suggestion_text(item) -> str:
+    """
+    Returns the text of a suggestion: the suggestion itself if it is a
+    string, else the ``headline_text`` of its data dict.
+    """
+
+    return item if isinstance(item, str) else item["headline_text"]
+
+
+class FSuggestionProvider(ABC):
+    """
+    Base class of the suggestion providers. Any object with a :meth:`search`
+    method can be used.
+    """
+
+    @abstractmethod
+    def search(self, text: str, limit: int) -> list:
+        """
+        Returns at most `limit` suggestions for `text`, called in a thread
+        pool. A suggestion is a string, or a data dict of
+        :class:`~fkivymd.uix.list.FRecycleListItem` with a ``headline_text``.
+        """
+
+
+class FPrefixIndex(FSuggestionProvider):
+    """
+    Suggests the items starting with the text, ignoring the case, in the
+    order of their text. `items` are strings or data dicts (see
+    :meth:`FSuggestionProvider.search`), `key` returns the searched text of
+    an item and defaults to :func:`get_suggestion_text`.
+
+    The index is built in a thread of its own, so the thread pool of the
+    text fields stays free for the searches and the validators. Searches
+    made before it is ready find nothing.
+    """
+
+    def __init__(self, items, key=None):
+        self._keys = []
+        self._items = []
+        self._error = None
+        self._built = threading.Event()
+        threading.Thread(
+            target=self._build_index,
+            args=(items, key or get_suggestion_text),
+            name="fkivymd-prefix-index",
+            daemon=True,
+        ).start()
+
+    @property
+    def ready(self) -> bool:
+        """`True` once the index is built."""
+
+        return self._built.is_set()
+
+    def search(self, text: str, limit: int) -> list:
+        if not self._built.is_set():
+            return []
+        if self._error is not None:
+            raise self._error
+        keys = self._keys
+        prefix = text.casefold()
+        start = bisect_left(keys, prefix)
+        end = bisect_left(
+            keys, prefix + _MAX_CHAR, start, min(len(keys), start + limit)
+        )
+        return self._items[start:end]
+
+    def _build_index(self, items, key) -> None:
+        # Runs in the thread of the index.
+        try:
+            items = list(items)
+            keys = [key(item).casefold() for item in items]
+            # Stable: items with the same text keep their order.
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._items = [items[index] for index in order]
+            self._keys = [keys[index] for index in order]
+        except Exception as error:
+            # Raised by the searches, logged by the text fields.
+            self._error = error
+        finally:
+            self._built.set()
+
+
+class FTextFieldSuggestionItem(FRecycleListItem):
+    """Row of :class:`FTextFieldSuggestions`, selects its suggestion."""
+
+    def on_release(self):
+        self._recycle_list.text_field.select_suggestion(self._index)
+
+
+class FTextFieldSuggestions(FRecycleList):
+    """
+    Dropdown of the suggestions of a text field, shown on the window under
+    the text field (above it if there is no room below).
+    """
+
+    text_field = ObjectProperty()
+    """The :class:`~fkivymd.uix.textfield.FTextField` of the suggestions."""
+
+    def open(self, suggestions: list) -> None:
+        """Shows `suggestions`, reusing the row views of the last ones."""
+
+        self.data = [
+            {"headline_text": item} if isinstance(item, str) else item
+            for item in suggestions
+        ]
+        self.scroll_y = 1
+        if not self.parent:
+            Window.add_widget(self)
+            self.text_field.fbind("pos", self._update_pos)
+            self.text_field.fbind("size", self._update_pos)
+        self._update_pos()
+
+    def dismiss(self) -> None:
+        if self.parent:
+            self.text_field.funbind("pos", self._update_pos)
+            self.text_field.funbind("size", self._update_pos)
+            self.parent.remove_widget(self)
+
+    def on_touch_down(self, touch):
+        if self.collide_point(*touch.pos) and touch not in FocusBehavior.ignored_touch:
+            # Scrolling or picking a suggestion keeps the focus of the text
+            # field, which would lose it on the release of the touch.
+            FocusBehavior.ignored_touch.append(touch)
+        return super().on_touch_down(touch)
+
+    def _update_pos(self, *args) -> None:
+        text_field = self.text_field
+        # Under the box of the text field, over its helper text.
+        left, bottom, right, top = text_field._bbox
+        self.width = right - left
+        self.height = (
+            sum(
+                get_item_height(data)
+                for data in self.data[:int(text_field.suggestion_max_rows)]
+            )
+            + 2 * self._list_vertical_padding
+        )
+        x, y = text_field.to_window(left, bottom)
+        if y - self.height < 0:
+            y = text_field.to_window(left, top)[1] + self.height
+        self.pos = x, y - self.height
@@ -164,6 +164,41 @@ minimize it on top of text::
         keep_hint_visible: True
         halign: 'right' # or 'center'
         multiline: True
+
+
+7. Validates the text off the main thread:
+
+The validators are called with the text in a shared thread pool, once
+the user stopped typing for `validation_delay` seconds. A validator
+returns an error message, or `None` if the text is valid. The first
+error is shown in place of the helper text, results of an older text
+are dropped::
+
+    def check_digit(text):
+        if not text.isdigit() or sum(map(int, text)) % 10:
+            return "Invalid account number"
+
+    FTextField(
+        hint_text="Account number",
+        validators=[check_digit, lookup_account],
+    )
+
+
+8. Suggests completions while typing:
+
+The provider is searched in the same thread pool, once the user stopped
+typing for `suggestion_delay` seconds; a search of an older text is
+cancelled or its results dropped. :class:`FPrefixIndex` indexes a list of
+strings or list item data dicts in a thread of its own. The suggestions are
+shown in a virtualized list under the text field::
+
+    from fkivymd.uix.textfield import FPrefixIndex
+
+    FTextField(
+        hint_text="Product",
+        suggestion_provider=FPrefixIndex(product_names),
+        on_suggestion=lambda instance, item: print(item),
+    )
 """
 
 
@@ -177,11 +212,16 @@ __all__ = (
 )
 
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang.builder import Builder
+from kivy.logger import Logger
 from kivy.properties import (
     StringProperty,
     ColorProperty, 
@@ -189,21 +229,62 @@ from kivy.properties import (
     VariableListProperty, 
     OptionProperty, 
     BooleanProperty, 
-    ObjectProperty
+    ObjectProperty,
+    ListProperty,
+)
+from kivy.graphics import (
+    Color,
+    InstructionGroup,
+    Line,
+    Rectangle,
+    RoundedRectangle,
+    SmoothLine,
 )
-from kivy.graphics import Color, Line, InstructionGroup
 from kivymd.uix.behaviors import DeclarativeBehavior
 from kivymd.theming import ThemableBehavior
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.textinput import TextInput
+from fkivymd.uix.behaviors import FLazyKVBehavior, FReadyBehavior
 from fkivymd.uix.button import FIconButton 
 from kivy.metrics import dp
 from kivymd.font_definitions import theme_font_styles
 
-with open(
-    os.path.join(uix_path, "textfield", "textfield.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "textfield", "textfield.kv"))
+
+# Thread pool of the validators of all the text fields, made on first use.
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="fkivymd-textfield"
+        )
+    return _executor
+
+
+def _on_task_done(ref, apply, task_id, future, *args) -> None:
+    text_field = ref()
+    if text_field is None:
+        return
+    error = future.exception()
+    if error is not None:
+        Logger.error(
+            "FKivyMD: A background task of %r failed", text_field, exc_info=error
+        )
+        return
+    getattr(text_field, apply)(task_id, future.result())
+
+
+def _run_validators(validators: tuple, text: str) -> str | None:
+    # Runs in the thread pool.
+    for validator in validators:
+        error = validator(text)
+        if error:
+            return error
+    return None
 
 
 class FTextFieldButton(FIconButton):
@@ -223,14 +304,14 @@ class FTextFieldTrailingButton(FTextFieldButton):
     pass
 
 
-class FTextFieldLeadingButtonContainer(BoxLayout):
+class FTextFieldLeadingButtonContainer(FLazyKVBehavior, BoxLayout):
     def add_widget(self, widget, *args, **kwargs):
         if not isinstance(widget, FTextFieldLeadingButton):
             return
         return super().add_widget(widget, *args, **kwargs)
     
 
-class FTextFieldTrailingButtonContainer(BoxLayout):
+class FTextFieldTrailingButtonContainer(FLazyKVBehavior, BoxLayout):
     def add_widget(self, widget, *args, **kwargs):
         if not isinstance(widget, FTextFieldTrailingButton):
             return
@@ -238,6 +319,8 @@ class FTextFieldTrailingButtonContainer(BoxLayout):
 
 
 class FTextField(
+    FLazyKVBehavior,
+    FReadyBehavior,
     DeclarativeBehavior, 
     ThemableBehavior,
     TextInput
@@ -339,7 +422,9 @@ class FTextField(
     max_length = NumericProperty()
     """
     Max text length number. If a number is set, user can
-    not type more than that number of characters.
+    not type more than that number of characters: the input
+    over the limit is cut in :meth:`insert_text`, before it
+    reaches the text.
     """
 
     font_style = StringProperty("Body")
@@ -379,9 +464,69 @@ class FTextField(
     hint text will disappear if there's text in text field.
     """
 
+    validators = ListProperty()
+    """
+    Callables validating the text, called in order with the text in a
+    thread pool. Each returns an error message, or `None` if the text is
+    valid; the chain stops at the first error.
+    """
+
+    validation_delay = NumericProperty(0.3)
+    """
+    Seconds without text change before the text is validated.
+    """
+
+    error = BooleanProperty(False)
+    """
+    If True, the text is invalid: :attr:`error_text` replaces the helper
+    text and the field is drawn with :attr:`error_color`.
+    """
+
+    error_text = StringProperty()
+    """Error message of the last validation"""
+
+    error_color = ColorProperty(None)
+    """Color of the outline, the line and the helper text on error"""
+
+    suggestion_provider = ObjectProperty(None, allownone=True)
+    """
+    Source of the suggestions shown under the text field while it has
+    focus: an object with a `search(text, limit)` method, called in a
+    thread pool, like
+    :class:`~fkivymd.uix.textfield.suggestion.FPrefixIndex`. If None, no
+    suggestions are shown.
+    """
+
+    suggestion_delay = NumericProperty(0.15)
+    """
+    Seconds without text change before the suggestions are searched.
+    """
+
+    suggestion_limit = NumericProperty(50)
+    """Maximum number of suggestions of a search"""
+
+    suggestion_min_length = NumericProperty(1)
+    """Length of the text from which suggestions are searched"""
+
+    suggestion_max_rows = NumericProperty(5)
+    """Number of suggestions visible without scrolling"""
+
+    suggestions = ListProperty()
+    """Suggestions shown for the current text"""
+
 
     # Text Region Boundary Box
     _bbox = VariableListProperty()
+    # Length of the text, shown by the max length label
+    _text_length = NumericProperty()
+    # Number of the last validation started, older results are dropped
+    _validation_id = 0
+    _validation_future = None
+    # Number of the last suggestion search, older results are dropped
+    _suggestion_id = 0
+    _suggestion_future = None
+    # Dropdown of the suggestions, made when first shown
+    _suggestions_view = None
     # Part of the hint text that will appear
     _extracted_hint_text = StringProperty()
     # Full hint text that will be stored at first
@@ -402,34 +547,401 @@ class FTextField(
     # Minimized width of hint text, used to calculate top lines positions
     _minimized_hint_text_width = 0
     # Under line color, used to animate line in 'line' style
-    _under_line_color = [0, 0, 0, 0]
+    _under_line_color = None
+    # Divider color between the text and the trailing buttons
+    _divider_color = ColorProperty([0, 0, 0, 0])
+
+    # Instructions of the style, drawn by `_update_canvas`
+    _style_group = None
+    _drawn_style = None
+    _fill_instructions = None
+    _indicator_instructions = None
+    _underline_instructions = None
+    # Line growing from or shrinking to the center on focus changes
+    _underline_focus_instructions = None
+    _underline_animation = None
+    _border_instructions = None
+    # Name -> (Color, Rectangle) of the icons, the divider and the texts
+    _content_instructions = None
+    _hint_text_rectangle = None
 
     # Buttons
-    _leading_button_container = FTextFieldLeadingButtonContainer()
-    _trailing_button_container = FTextFieldTrailingButtonContainer()
     _leading_buttons_added = False
     _trailing_buttons_added = False
-    _leading_buttons = []
-    _trailing_buttons = []
+
+    __events__ = ("on_suggestion",)
 
     def __init__(self, *args, **kwargs):
+        self._leading_button_container = FTextFieldLeadingButtonContainer()
+        self._trailing_button_container = FTextFieldTrailingButtonContainer()
+        self._leading_buttons = []
+        self._trailing_buttons = []
+        # Before the next frame, when the layout has placed the buttons.
+        self._trigger_update_pos = Clock.create_trigger(self.on_pos, -1)
+        self._trigger_update_canvas = Clock.create_trigger(self._update_canvas, -1)
+        self._trigger_validation = Clock.create_trigger(self.validate)
+        self._trigger_suggestions = Clock.create_trigger(self.update_suggestions)
         super().__init__(*args, **kwargs)
-        # Update buttons position when created using python
-        Clock.schedule_once(lambda x: self._update_top_outline_pos(), 1.05)
+        self._create_canvas_instructions()
+        for name in (
+            "pos",
+            "size",
+            "style",
+            "focus",
+            "radius",
+            "helper_text",
+            "helper_text_style",
+            "max_length",
+            "leading_icon",
+            "trailing_icon",
+            "button_divider",
+            "keep_hint_visible",
+            "error",
+            "error_text",
+            "error_color",
+            "_extracted_hint_text",
+            "_top_left_line_pos",
+            "_top_right_line_pos",
+            "_component_padding",
+            "_divider_color",
+            "fill_color",
+            "fill_color_focus",
+            "line_color",
+            "line_color_focus",
+            "border_color",
+            "border_color_focus",
+            "leading_icon_color",
+            "leading_icon_color_focus",
+            "trailing_icon_color",
+            "trailing_icon_color_focus",
+            "helper_text_color",
+            "helper_text_color_focus",
+            "max_length_color",
+            "max_length_color_focus",
+        ):
+            self.fbind(name, self._trigger_update_canvas)
+        for label in (
+            self.leading_icon_label,
+            self.trailing_icon_label,
+            self.helper_text_label,
+            self.max_length_label,
+        ):
+            label.fbind("texture", self._trigger_update_canvas)
+            label.fbind("texture_size", self._trigger_update_canvas)
+        # The label renders again when the text or the focus change its
+        # font size, the old texture must not be drawn.
+        self.hint_text_label.fbind("texture", self._update_hint_text_rectangle)
+        self.hint_text_label.fbind("texture_size", self._update_hint_text_rectangle)
+        for container in (
+            self._leading_button_container,
+            self._trailing_button_container,
+        ):
+            container.fbind("width", self._trigger_update_canvas)
+        self._update_canvas()
+
+    def on_ready(self, *args) -> None:
+        # Place the hint text, the top outline and the buttons for the first
+        # frame, they follow the changes of the text field afterwards.
+        if self.keep_hint_visible and self._original_hint_text:
+            self._add_hint_text_label(
+                self._split_smart(self._original_hint_text)[0][0]
+            )
+        self.on_pos()
 
     def add_widget(self, widget, *args, **kwargs):
         if isinstance(widget, FTextFieldTrailingButton):
             widget._parent = self
             self._trailing_button_container.add_widget(widget, *args, **kwargs)
             self._trailing_buttons.append(widget)
+            self._trigger_update_canvas()
             return
         if isinstance(widget, FTextFieldLeadingButton):
             widget._parent = self
             self._leading_button_container.add_widget(widget, *args, **kwargs)
             self._leading_buttons.append(widget)
+            self._trigger_update_canvas()
             return
         return super().add_widget(widget, *args, **kwargs)
 
+    def _create_canvas_instructions(self) -> None:
+        # The instructions of the style come first, then the icons, the
+        # divider and the texts, then the cursor and the text color of the
+        # kv rule.
+        self._style_group = InstructionGroup()
+        content_group = InstructionGroup()
+        self._content_instructions = {}
+        for name in (
+            "leading_icon",
+            "divider",
+            "trailing_icon",
+            "helper_text",
+            "max_length",
+        ):
+            color = Color(rgba=[0, 0, 0, 0])
+            rectangle = Rectangle(size=(0, 0))
+            content_group.add(color)
+            content_group.add(rectangle)
+            self._content_instructions[name] = (color, rectangle)
+        self.canvas.before.insert(0, content_group)
+        self.canvas.before.insert(0, self._style_group)
+
+        self.canvas.after.add(Color(rgba=[1, 1, 1, 1]))
+        self._hint_text_rectangle = Rectangle(size=(0, 0))
+        self.canvas.after.add(self._hint_text_rectangle)
+
+    def _create_style_instructions(self) -> None:
+        # Only the instructions of the current style are in the canvas.
+        if self._underline_animation is not None:
+            self._underline_animation.cancel(self._underline_focus_instructions[1])
+            self._underline_animation = None
+        group = self._style_group
+        group.clear()
+        self._fill_instructions = None
+        self._indicator_instructions = None
+        self._underline_instructions = None
+        self._underline_focus_instructions = None
+        self._border_instructions = None
+        self._drawn_style = self.style
+
+        if self.style == "filled":
+            self._fill_instructions = (Color(), RoundedRectangle())
+            self._indicator_instructions = (Color(), Line())
+            instructions = (
+                *self._fill_instructions,
+                *self._indicator_instructions,
+            )
+        elif self.style == "line":
+            self._underline_instructions = (Color(), Line(width=dp(1)))
+            self._underline_focus_instructions = (
+                Color(rgba=[0, 0, 0, 0]),
+                Line(width=dp(1)),
+            )
+            instructions = (
+                *self._underline_instructions,
+                *self._underline_focus_instructions,
+            )
+        elif self.style == "outlined":
+            # Top right, bottom right, top left and bottom left corners,
+            # left, right and bottom lines, top left and top right parts of
+            # the top line.
+            self._border_instructions = (
+                Color(),
+                [SmoothLine() for _ in range(9)],
+            )
+            instructions = (
+                self._border_instructions[0],
+                *self._border_instructions[1],
+            )
+        else:
+            instructions = ()
+        for instruction in instructions:
+            group.add(instruction)
+
+    def _update_metrics(self) -> None:
+        outlined = self.style == "outlined"
+        self._outline_thickness = dp(1.25) if self.focus else dp(1)
+        self._outlined_reduce_height = (
+            dp(8) if outlined and self.keep_hint_visible else 0
+        )
+        self._filled_pad_downside = (
+            dp(7) if not outlined and self.keep_hint_visible else 0
+        )
+        bottom_text = bool(self.helper_text or self.max_length or self.error)
+        self.padding = [
+            (dp(5) + self._leading_button_container.width)
+            if self._leading_buttons
+            else (dp(45) if self.leading_icon else self._component_padding),
+            dp(19) + self._filled_pad_downside + self._outlined_reduce_height,
+            (dp(5) + self._trailing_button_container.width)
+            if self._trailing_buttons
+            else (dp(50) if self.trailing_icon else self._component_padding),
+            self._component_padding
+            - self._filled_pad_downside
+            + (dp(15) if bottom_text else 0),
+        ]
+        self._bbox = [
+            self.x,
+            self.y + (self.padding[3] - dp(15) if bottom_text else 0),
+            self.x + self.width,
+            self.y + self.height - self._outlined_reduce_height,
+        ]
+
+    def _update_canvas(self, *args) -> None:
+        """
+        Updates the padding and the instructions of the text field, once
+        per frame whatever number of its properties changed.
+        """
+
+        self._update_metrics()
+        if self._drawn_style != self.style:
+            self._create_style_instructions()
+
+        x, y = self.pos
+        width, height = self.size
+        focus = self.focus
+        radius = self.radius
+        left, bottom, right, top = self._bbox
+        padding = self._component_padding
+        # Height of the helper and max length texts under the text region.
+        bottom_offset = (
+            self.padding[3] + self._filled_pad_downside - padding
+            if self.helper_text or self.max_length or self.error
+            else 0
+        )
+        # Replaces the colors of the lines and of the helper text.
+        error_color = self.error_color if self.error else None
+
+        if self._fill_instructions:
+            color, rectangle = self._fill_instructions
+            color.rgba = (
+                self.fill_color_focus if focus else self.fill_color
+            ) or [0, 0, 0, 0]
+            rectangle.pos = (x, y + bottom_offset)
+            rectangle.size = (width, height - bottom_offset)
+            rectangle.radius = [radius[0], radius[1], 0, 0]
+
+            color, line = self._indicator_instructions
+            color.rgba = (
+                error_color
+                or (self.line_color_focus if focus else self.line_color)
+                or [0, 0, 0, 0]
+            )
+            line.width = self._outline_thickness
+            line.points = [
+                x + dp(1 if focus else 0),
+                y + bottom_offset,
+                x + width - dp(1 if focus else 0),
+                y + bottom_offset,
+            ]
+
+        if self._underline_instructions:
+            color, line = self._underline_instructions
+            color.rgba = (
+                error_color
+                or self._under_line_color
+                or (
+                    self.line_color_focus
+                    if focus
+                    else (
+                        self.line_color[:-1] + [0.3]
+                        if self.line_color
+                        else [0, 0, 0, 0]
+                    )
+                )
+                or [0, 0, 0, 0]
+            )
+            line.points = [
+                x + dp(1 if focus else 0),
+                y + dp(3) + bottom_offset,
+                x + width - dp(1 if focus else 0),
+                y + dp(3) + bottom_offset,
+            ]
+
+        if self._border_instructions:
+            color, lines = self._border_instructions
+            color.rgba = (
+                error_color
+                or (self.border_color_focus if focus else self.border_color)
+                or [0, 0, 0, 0]
+            )
+            if self.keep_hint_visible and self._extracted_hint_text:
+                top_left_line_pos = self._top_left_line_pos
+                top_right_line_pos = self._top_right_line_pos
+            else:
+                top_left_line_pos = top_right_line_pos = x + width / 2
+            for line in lines:
+                line.width = self._outline_thickness
+            lines[0].circle = (right - radius[1], top - radius[1], radius[1], 0, 90)
+            lines[1].circle = (
+                right - radius[2], bottom + radius[2], -radius[2], 0, -90
+            )
+            lines[2].circle = (
+                left + radius[0], top - radius[0], -radius[0], 180, 90
+            )
+            lines[3].circle = (
+                left + radius[3], bottom + radius[3], -radius[3], 0, 90
+            )
+            lines[4].points = [
+                left, bottom + radius[3], left, top - radius[0]
+            ]
+            lines[5].points = [
+                right, bottom + radius[2], right, top - radius[1]
+            ]
+            lines[6].points = [
+                left + radius[3], bottom, right - radius[2], bottom
+            ]
+            lines[7].points = [left + radius[0], top, top_left_line_pos, top]
+            lines[8].points = [right - radius[1], top, top_right_line_pos, top]
+
+        content = self._content_instructions
+
+        label = self.leading_icon_label
+        color, rectangle = content["leading_icon"]
+        color.rgba = (
+            self.leading_icon_color_focus if focus else self.leading_icon_color
+        ) or [1, 0, 0, 0]
+        rectangle.texture = label.texture
+        rectangle.size = label.texture_size
+        rectangle.pos = (x + padding, top - padding - label.texture_size[1])
+
+        trailing_buttons = len(self._trailing_buttons)
+        color, rectangle = content["divider"]
+        color.rgba = (
+            self._divider_color
+            if (self.trailing_icon or trailing_buttons) and self.button_divider
+            else [0, 0, 0, 0]
+        )
+        rectangle.size = (1, dp(25))
+        rectangle.pos = (
+            right
+            - (
+                trailing_buttons * dp(40) + padding
+                if trailing_buttons
+                else (dp(40) + padding if self.trailing_icon else 0)
+            ),
+            top - dp(25) - padding,
+        )
+
+        label = self.trailing_icon_label
+        color, rectangle = content["trailing_icon"]
+        color.rgba = (
+            self.trailing_icon_color_focus if focus else self.trailing_icon_color
+        ) or [1, 0, 0, 0]
+        rectangle.texture = label.texture
+        rectangle.size = label.texture_size
+        rectangle.pos = (
+            right - label.texture_size[0] - padding,
+            top - padding - label.texture_size[1],
+        )
+
+        label = self.helper_text_label
+        color, rectangle = content["helper_text"]
+        color.rgba = (
+            error_color
+            or (
+                self.helper_text_color_focus
+                if focus
+                else (
+                    self.helper_text_color
+                    if self.helper_text_style == "persistent"
+                    else [0, 0, 0, 0]
+                )
+            )
+            or [0, 0, 0, 0]
+        )
+        rectangle.texture = label.texture
+        rectangle.size = label.texture_size
+        rectangle.pos = (left + dp(5), y)
+
+        label = self.max_length_label
+        color, rectangle = content["max_length"]
+        color.rgba = (
+            self.max_length_color_focus if focus else self.max_length_color
+        ) or [1, 0, 0, 0]
+        rectangle.texture = label.texture
+        rectangle.size = label.texture_size
+        rectangle.pos = (right - label.texture_size[0] - dp(5), y)
+
     def _add_buttons(self, category): # category: lead or trail
         if category == 'trail':
             if len(self._trailing_buttons) and self._trailing_button_container:
@@ -514,24 +1026,29 @@ class FTextField(
 
     def _add_hint_text_label(self, text:str) -> None:
         self._extracted_hint_text = text
-        hint_text_rectangle = self.canvas.after.get_group("hint-text-rectangle")[0]
+        hint_text_rectangle = self._hint_text_rectangle
         self.hint_text_label.texture_update()
         hint_text_rectangle.texture = self.hint_text_label.texture
         hint_text_rectangle.size = self.hint_text_label.texture_size
         hint_text_rectangle.pos = self._get_hint_text_pos()
         self._refresh_hint_text()
 
+    def _update_hint_text_rectangle(self, *args) -> None:
+        hint_text_rectangle = self._hint_text_rectangle
+        hint_text_rectangle.texture = self.hint_text_label.texture
+        hint_text_rectangle.size = self.hint_text_label.texture_size
+
     def _remove_hint_text_label(self, *_) -> None:
         self._extracted_hint_text = ''
         self.hint_text_label.texture_update()
-        hint_text_rectangle = self.canvas.after.get_group("hint-text-rectangle")[0]
+        hint_text_rectangle = self._hint_text_rectangle
         hint_text_rectangle.texture = None
         hint_text_rectangle.size = [0,0]
         self._refresh_hint_text()
 
     def _update_hint_canvas(self):
         self.hint_text_label.texture_update()
-        hint_text_rectangle = self.canvas.after.get_group("hint-text-rectangle")[0]
+        hint_text_rectangle = self._hint_text_rectangle
         hint_text_rectangle.texture = self.hint_text_label.texture
         Animation(pos=hint_text_rectangle.pos, d=0).start(hint_text_rectangle)
         return hint_text_rectangle
@@ -570,6 +1087,165 @@ class FTextField(
             else:
                 self._top_left_line_pos, self._top_right_line_pos = self._get_top_outline_pos()
     
+    def insert_text(self, substring, from_undo=False):
+        if self.max_length and substring:
+            # The text is cached by `TextInput`, its length is not counted.
+            room = int(self.max_length) - len(self.text)
+            if len(substring) > room:
+                substring = substring[:max(0, room)]
+                if not substring:
+                    return
+        return super().insert_text(substring, from_undo=from_undo)
+
+    def on_text(self, instance, text) -> None:
+        # Only the text set from code can be over the limit.
+        if self.max_length and len(text) > self.max_length:
+            self.text = text[:int(self.max_length)]
+            return
+        self._text_length = len(text)
+        if self.validators:
+            self._restart_trigger(self._trigger_validation, self.validation_delay)
+        if self.suggestion_provider is not None and self.focus:
+            self._restart_trigger(self._trigger_suggestions, self.suggestion_delay)
+
+    def _restart_trigger(self, trigger, delay: float) -> None:
+        # Restarts the delay on every change.
+        trigger.cancel()
+        trigger.timeout = delay
+        trigger()
+
+    def _submit(self, apply: str, task_id: int, function, *args):
+        """
+        Calls `function(*args)` in the thread pool, then the method `apply`
+        with `task_id` and the result in a frame. Returns the future.
+        """
+
+        future = _get_executor().submit(function, *args)
+        # The pool does not keep the text field alive.
+        ref = weakref.ref(self)
+
+        def on_done(future) -> None:
+            # Called in the thread pool.
+            if future.cancelled():
+                return
+            Clock.schedule_once(partial(_on_task_done, ref, apply, task_id, future))
+
+        future.add_done_callback(on_done)
+        return future
+
+    def validate(self, *args) -> None:
+        """
+        Validates the text now, without waiting for
+        :attr:`validation_delay`. The result is applied in a later frame.
+        """
+
+        self._trigger_validation.cancel()
+        if self._validation_future is not None:
+            # Not started yet, or its result is dropped.
+            self._validation_future.cancel()
+        self._validation_id += 1
+        if not self.validators:
+            self._apply_validation(self._validation_id, None)
+            return
+
+        self._validation_future = self._submit(
+            "_apply_validation",
+            self._validation_id,
+            _run_validators,
+            tuple(self.validators),
+            self.text,
+        )
+
+    def on_validators(self, *_) -> None:
+        if not self.validators:
+            # Clears the error of the removed validators.
+            self.validate()
+        elif self.text:
+            # The text is checked against the new validators.
+            self._restart_trigger(self._trigger_validation, self.validation_delay)
+
+    def _apply_validation(self, validation_id: int, error: str | None) -> None:
+        if validation_id != self._validation_id:
+            return
+        self._validation_future = None
+        self.error_text = error or ""
+        self.error = bool(error)
+
+    def update_suggestions(self, *args) -> None:
+        """
+        Searches the suggestions of the text now, without waiting for
+        :attr:`suggestion_delay`. The result is shown in a later frame.
+        """
+
+        self._cancel_suggestion_search()
+        if (
+            self.suggestion_provider is None
+            or len(self.text) < self.suggestion_min_length
+        ):
+            self.suggestions = []
+            return
+
+        self._suggestion_future = self._submit(
+            "_apply_suggestions",
+            self._suggestion_id,
+            self.suggestion_provider.search,
+            self.text,
+            int(self.suggestion_limit),
+        )
+
+    def dismiss_suggestions(self) -> None:
+        """Hides the suggestions and drops the pending search."""
+
+        self._cancel_suggestion_search()
+        self.suggestions = []
+
+    def select_suggestion(self, index: int) -> None:
+        """
+        Sets the text to the suggestion at `index` of :attr:`suggestions`,
+        hides the suggestions and dispatches `on_suggestion`.
+        """
+
+        from fkivymd.uix.textfield.suggestion import get_suggestion_text
+
+        item = self.suggestions[index]
+        self.text = get_suggestion_text(item)
+        self.dismiss_suggestions()
+        self.dispatch("on_suggestion", item)
+
+    def on_suggestion(self, item) -> None:
+        """Fired when the user picks the suggestion `item`."""
+
+    def on_suggestions(self, instance, suggestions) -> None:
+        if suggestions:
+            if self._suggestions_view is None:
+                from fkivymd.uix.textfield.suggestion import FTextFieldSuggestions
+
+                self._suggestions_view = FTextFieldSuggestions(text_field=self)
+            self._suggestions_view.open(suggestions)
+        elif self._suggestions_view is not None:
+            self._suggestions_view.dismiss()
+
+    def on_suggestion_provider(self, *_) -> None:
+        self.dismiss_suggestions()
+
+    def _cancel_suggestion_search(self) -> None:
+        self._trigger_suggestions.cancel()
+        if self._suggestion_future is not None:
+            # Not started yet, or its result is dropped.
+            self._suggestion_future.cancel()
+            self._suggestion_future = None
+        self._suggestion_id += 1
+
+    def _apply_suggestions(self, suggestion_id: int, suggestions: list) -> None:
+        if suggestion_id != self._suggestion_id:
+            return
+        self._suggestion_future = None
+        # The focus may be lost while searching.
+        self.suggestions = list(suggestions) if self.focus else []
+
+    def on_max_length(self, *_) -> None:
+        self.on_text(self, self.text)
+
     def on_hint_text(self, *args):
         if self.hint_text:
             self._original_hint_text = self.hint_text
@@ -596,6 +1272,9 @@ class FTextField(
                 self._update_top_outline_pos()
 
     def on_focus(self, *_):
+        if not self.focus:
+            self.dismiss_suggestions()
+
         if self.keep_hint_visible and self._extracted_hint_text:
             self.hint_text_label.font_size = (
                 theme_font_styles['Body']['small']['font-size']
@@ -617,40 +1296,40 @@ class FTextField(
                 )
 
         if self.style == 'line':
-            line_points = self.canvas.before.get_group("line-style-line")[0].points
-            ini_x = self.center_x
-            ini_y = line_points[1]
-
-            ini_points = ([ini_x, ini_y, ini_x, ini_y] 
-                          if self.focus else 
-                          line_points)
-            final_points = (line_points if self.focus else 
-                            [ini_x, ini_y, ini_x, ini_y])
-            
-            self.under_line_group = InstructionGroup()
-            self.under_line_group.add(
-                Color(rgba=self.line_color_focus)
-            )
-            self._line = Line(
-                        group='line-style-line2', 
-                        width=dp(1), 
-                        points=ini_points
-                    )
-            self.under_line_group.add(self._line)
-            self.canvas.before.add(self.under_line_group)
+            # The points of the new focus state.
+            self._update_canvas()
+            line_points = self._underline_instructions[1].points
+            center_points = [
+                self.center_x, line_points[1], self.center_x, line_points[1]
+            ]
+            color, line = self._underline_focus_instructions
+
+            # A focus change during the animation reverses it from where
+            # it is.
+            if self._underline_animation is not None:
+                self._underline_animation.cancel(line)
+            else:
+                line.points = center_points if self.focus else line_points
+            color.rgba = self.line_color_focus
             self._under_line_color = self.line_color[:-1] + [.3]
-            anim = Animation(points=final_points, d=.15)
-            anim.bind(on_complete=self._remove_under_line2)
-            anim.start(self._line)
-
-    def _remove_under_line2(self, *_):
-        if hasattr(self, '_line'):
-            self.canvas.before.remove(self.under_line_group)
-        self.canvas.before.get_group("line-style-line-color")[0].rgba = (
+
+            self._underline_animation = Animation(
+                points=line_points if self.focus else center_points, d=.15
+            )
+            self._underline_animation.bind(
+                on_complete=self._on_underline_animation_complete
+            )
+            self._underline_animation.start(line)
+
+    def _on_underline_animation_complete(self, animation, line) -> None:
+        self._underline_animation = None
+        self._underline_focus_instructions[0].rgba = [0, 0, 0, 0]
+        self._under_line_color = (
             self.line_color_focus 
             if self.focus else 
             self.line_color[:-1] + [.3]
         )
+        self._trigger_update_canvas()
 
     def set_space_in_line(
         self, left_width: float | int, right_width: float | int
@@ -677,14 +1356,14 @@ class FTextField(
             - self._outlined_reduce_height])
             
         if self.keep_hint_visible and self._extracted_hint_text:
-            hint_text_rectangle = self.canvas.after.get_group("hint-text-rectangle")[0]
+            hint_text_rectangle = self._hint_text_rectangle
             hint_text_rectangle.pos = self._get_hint_text_pos()
 
             if self.style == 'outlined':
                 self._update_top_outline_pos()
 
     def on_size(self, *_):
-        Clock.schedule_once(self.on_pos)
+        self._trigger_update_pos()
     
     def on_opacity(self, *_):
         if self.opacity > 0:
@@ -3,7 +3,6 @@ import os
 from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
-from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import (
     BoundedNumericProperty,
@@ -19,6 +18,7 @@ from kivymd.uix.behaviors.state_layer_behavior import StateLayerBehavior
 from fkivymd.uix.button import FButton
 from fkivymd.uix.label import FLabel
 from fkivymd import uix_path
+from fkivymd.kv_loader import register_kv
 from kivymd.material_resources import DEVICE_TYPE
 from kivymd.theming import ThemableBehavior
 from kivymd.uix.behaviors import (
@@ -29,10 +29,7 @@ from kivymd.uix.behaviors import (
     CommonElevationBehavior,
 )
 
-with open(
-    os.path.join(uix_path, "tooltip", "tooltip.kv"), encoding="utf-8"
-) as kv_file:
-    Builder.load_string(kv_file.read())
+register_kv(__name__, os.path.join(uix_path, "tooltip", "tooltip.kv"))
 
 # size_min_y = 24dp
 # size_max_x = Window.size